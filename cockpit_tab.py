@@ -3,21 +3,19 @@ import sys
 import math
 import csv
 import time
+import logging
 from pathlib import Path
+import numpy as np
 
 os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", "--disable-gpu")
 
-from PySide6.QtCore import Qt, QTimer, QUrl, QSize
-from PySide6.QtGui import QPixmap, QImage, QColor, QPainter, QFont, QPen, QBrush, QLinearGradient
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QScrollArea, QSizePolicy, QPushButton, QDialog, QApplication, QFileDialog
+log = logging.getLogger(__name__)
 
-# Optional WebEngine/Multimedia imports
-HAS_WEBENGINE = True
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-except Exception:
-    HAS_WEBENGINE = False
+from PySide6.QtCore import Qt, QTimer, QUrl, QSize, QRect, QPointF, QRectF, QObject, QThread, QThreadPool, QRunnable, Signal, Slot
+from PySide6.QtGui import QPixmap, QImage, QColor, QPainter, QFont, QPen, QBrush, QLinearGradient, QConicalGradient
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, QFrame, QScrollArea, QSizePolicy, QPushButton, QDialog, QApplication, QFileDialog
 
+# Optional Multimedia imports
 USE_MULTIMEDIA = True
 try:
     from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
@@ -25,12 +23,6 @@ try:
 except Exception:
     USE_MULTIMEDIA = False
 
-try:
-    import cv2
-    HAS_CV2 = True
-except Exception:
-    HAS_CV2 = False
-
 def silent(func):
     def wrapped(*args, **kwargs):
         try:
@@ -40,48 +32,158 @@ def silent(func):
             return None
     return wrapped
 
-def make_plotly_gauge_html(title, minv, maxv, initv, barcolor="#2B84D6", textcolor="#111111"):
-    html = f"""<!doctype html>
-<html>
-<head>
-<meta charset="utf-8">
-<style>
-html,body{{margin:0;height:100%;background:transparent}}
-body{{font-family:Segoe UI,sans-serif}}
-.plotly .modebar{{display:none!important}}
-</style>
-<script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-</head>
-<body>
-<div id="g"></div>
-<script>
-var data = [{{
-    type: "indicator",
-    mode: "gauge+number",
-    value: {initv},
-    title: {{text: "{title}", font: {{size:22, color:"{textcolor}"}}}},
-    number: {{font: {{size: 24, color: "{textcolor}"}}}},
-    gauge: {{
-        axis: {{range:[{minv},{maxv}], tickcolor:"#333", nticks:6, tickfont:{{size:13, color:"{textcolor}"}}}},
-        bar: {{color:"{barcolor}"}},
-        bgcolor:"rgba(0,0,0,0)", borderwidth:0,
-        steps:[
-            {{range:[{minv},{maxv}], color:"rgba(0,128,255,0.08)"}}
-        ],
-        threshold: {{value: {0.92*maxv}, line: {{color: "red", width: 3}}, thickness:0.75}}
-    }}
-}}];
-var layout = {{margin:{{l:8,r:8,t:12,b:8}}, paper_bgcolor:"rgba(0,0,0,0)", font:{{family:"Segoe UI", color:"{textcolor}"}}, height:180}};
-Plotly.newPlot('g', data, layout, {{displayModeBar:false, responsive:true}});
-window.updateGauge = function(val) {{
-    try{{
-        Plotly.restyle('g', 'value', [Number(val) || 0], 0);
-    }}catch(e){{}}
-}};
-</script>
-</body>
-</html>"""
-    return html
+TELEMETRY_COLUMNS = ("TempC", "PressurePa", "Accelms2", "Altitudem")
+
+def load_telemetry_rows(path):
+    """Parse a telemetry CSV once into (t, p, a, alt) float tuples; missing fields are None."""
+    # DictReader copes with a half-written last line and quoted commas
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return [tuple(_rowfloat(row, c) for c in TELEMETRY_COLUMNS) for row in csv.DictReader(f)]
+
+class _CsvLoaderSignals(QObject):
+    loaded = Signal(object)
+
+class CsvLoader(QRunnable):
+    """Runs load_telemetry_rows on the thread pool and emits the rows."""
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = _CsvLoaderSignals()
+
+    def run(self):
+        try:
+            rows = load_telemetry_rows(self.path)
+        except Exception as e:
+            log.warning("Failed to read telemetry CSV: %s", e)
+            rows = []
+        self.signals.loaded.emit(rows)
+
+def _rowfloat(row, key):
+    v = row.get(key)
+    if v is None or v == "":
+        return None
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+# key -> (title, min, max, initial value, bar colour, decimals)
+GAUGE_SPECS = {
+    "t": ("Temperature (C)", -50, 150, 20.0, "#FF7043", 1),
+    "p": ("Pressure (Pa)", 800, 1200, 1013.25, "#42A5F5", 1),
+    "a": ("Acceleration (m/s²)", 0, 20, 0.0, "#66BB6A", 2),
+}
+
+class QtGauge(QWidget):
+    def __init__(self, title="", min_v=0.0, max_v=100.0, value=None, bar_color="#2B84D6", decimals=1, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.min_v = float(min_v)
+        self.max_v = float(max_v)
+        self._value = self.min_v if value is None else float(value)
+        self.bar_color = QColor(bar_color)
+        self.decimals = decimals
+        self.threshold = 0.92 * self.max_v
+        self.setMinimumSize(320, 180)
+        self.titlefont = QFont("Segoe UI", 11, QFont.Bold)
+        self.valuefont = QFont("Consolas", 16, QFont.Bold)
+        self.tickfont = QFont("Segoe UI", 8)
+        self._layout = None
+
+    def value(self):
+        return self._value
+
+    @Slot(float)
+    def setValue(self, value):
+        old = self._value
+        self._value = float(value)
+        # Skip the repaint when neither the readout nor the arc would change
+        d = self.decimals
+        if (f"{self._value:.{d}f}" == f"{old:.{d}f}"
+                and int(180*16*self._frac(self._value)) == int(180*16*self._frac(old))):
+            return
+        self.update()
+
+    def _frac(self, v):
+        span = self.max_v - self.min_v
+        if not span:
+            return 0.0
+        return max(0.0, min(1.0, (v - self.min_v) / span))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout = None
+
+    def _build_layout(self):
+        # Dial geometry depends only on size and range, never on the value
+        r = self.rect()
+        side = max(40, min(r.width() - 40, 2 * (r.height() - 40)))
+        thick = max(10, side // 7)
+        cx = r.width() / 2
+        cy = r.top() + 30 + side / 2
+        radius = side / 2
+        band = QRectF(cx - radius + thick/2, cy - radius + thick/2, side - thick, side - thick)
+        grad = QConicalGradient(cx, cy, 180)
+        grad.setColorAt(0.0, self.bar_color.lighter(150))
+        grad.setColorAt(0.5, self.bar_color)
+
+        ang = math.pi * (1 - self._frac(self.threshold))
+        threshold = (QPointF(cx + (radius - thick*0.9)*math.cos(ang), cy - (radius - thick*0.9)*math.sin(ang)),
+                     QPointF(cx + (radius - thick*0.1)*math.cos(ang), cy - (radius - thick*0.1)*math.sin(ang)))
+
+        ticks = []
+        nticks = 6
+        inner = radius - thick
+        for i in range(nticks):
+            f = i / (nticks-1)
+            ang = math.pi * (1 - f)
+            c, s = math.cos(ang), math.sin(ang)
+            val = self.min_v + f * (self.max_v - self.min_v)
+            lx = cx + (inner-18)*c
+            ly = cy - (inner-18)*s
+            ticks.append((QPointF(cx + inner*c, cy - inner*s), QPointF(cx + (inner-6)*c, cy - (inner-6)*s),
+                          QRectF(int(lx)-24, int(ly)-8, 48, 16), f"{val:g}"))
+
+        return {
+            "title": QRectF(r.left(), r.top()+4, r.width(), 20),
+            "band": band,
+            "track_pen": QPen(QColor(0, 128, 255, 20), thick, Qt.SolidLine, Qt.FlatCap),
+            "bar_pen": QPen(QBrush(grad), thick, Qt.SolidLine, Qt.FlatCap),
+            "threshold": threshold,
+            "ticks": ticks,
+            "value": QRectF(int(cx - radius), int(cy - 34), int(side), 30),
+        }
+
+    def paintEvent(self, event):
+        if self._layout is None:
+            self._layout = self._build_layout()
+        g = self._layout
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(QColor("#111111")))
+        p.setFont(self.titlefont)
+        p.drawText(g["title"], Qt.AlignCenter, self.title)
+
+        p.setPen(g["track_pen"])
+        p.drawArc(g["band"], 180*16, -180*16)
+        frac = self._frac(self._value)
+        if frac > 0:
+            p.setPen(g["bar_pen"])
+            p.drawArc(g["band"], 180*16, -int(180*16*frac))
+
+        p.setPen(QPen(QColor("red"), 3))
+        p.drawLine(*g["threshold"])
+
+        p.setPen(QPen(QColor("#333333"), 1.0))
+        p.setFont(self.tickfont)
+        for start, end, rect, text in g["ticks"]:
+            p.drawLine(start, end)
+            p.drawText(rect, Qt.AlignCenter, text)
+
+        p.setPen(QPen(QColor("#111111")))
+        p.setFont(self.valuefont)
+        p.drawText(g["value"], Qt.AlignHCenter | Qt.AlignBottom, f"{self._value:.{self.decimals}f}")
+        p.end()
 
 class AltitudeCylinder(QWidget):
     def __init__(self, maxalt=1500, rocketpath=None, parent=None):
@@ -89,88 +191,219 @@ class AltitudeCylinder(QWidget):
         self.maxalt = float(maxalt)
         self.alt = 0.0
         self.rocketpath = rocketpath
-        self.rocket = QPixmap(self.rocketpath) if self.rocketpath and os.path.exists(self.rocketpath) else None
+        # Decoded on first paint so hidden cockpits never touch the image
+        self.rocket = None
+        self._rocket_loaded = False
         self.setMinimumSize(120, 420)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
         self.titlefont = QFont("Segoe UI", 11, QFont.Bold)
         self.valuefont = QFont("Consolas", 14, QFont.Bold)
-
-    @silent
+        self._tick_font = QFont("Consolas", 9)
+        self._bg_color = QColor("#f2f2f2")
+        self._panel_pen = QPen(QColor("#d0d0d0"), 1.2)
+        self._panel_brush = QBrush(QColor("#e8e8e8"))
+        self._track_pen = QPen(QColor("#cccccc"), 1.0)
+        self._track_brush = QBrush(QColor("#ededed"))
+        self._text_pen = QPen(QColor("#111111"))
+        # Stops are fixed; only the endpoints move with the altitude
+        self._fill_grad = QLinearGradient()
+        self._fill_grad.setColorAt(0.0, QColor("#4fd2ff"))
+        self._fill_grad.setColorAt(1.0, QColor("#006b96"))
+        self._geom = None
+        self._bg_cache = None
+        self._rocket_scaled = None
+        self._shown = None
+
+    @Slot(float)
     def setAltitude(self, value):
         try:
             v = float(value)
-        except Exception:
+        except (TypeError, ValueError):
             v = 0.0
         self.alt = max(0.0, min(self.maxalt, v))
+        # Repaint only when the readout or the fill height moves by a pixel
+        shown = None
+        if self._geom is not None and self.maxalt:
+            shown = (int(self.alt), int(max(6, self._geom[7]*self.alt/self.maxalt)))
+            if shown == self._shown:
+                return
+        self._shown = shown
         self.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._geom = None
+        self._bg_cache = None
+        self._rocket_scaled = None
+        self._shown = None
+
+    def _build_geometry(self):
         r = self.rect()
         pad = 10
         inner = r.adjusted(pad, pad, -pad, -pad)
-        p.fillRect(r, QColor("#f2f2f2"))
-        p.setPen(QPen(QColor("#d0d0d0"), 1.2))
-        p.setBrush(QBrush(QColor("#e8e8e8")))
-        p.drawRoundedRect(inner, 12, 12)
         left = inner.left()
         right = inner.right() - 12
         top = inner.top() + 24
         bottom = inner.bottom() - 38
         width = right - left
         height = bottom - top
+        ticks = 6
+        ticklist = []
+        for i in range(ticks):
+            frac = i / (ticks-1)
+            ticklist.append((int(bottom - frac*height), str(int(round(frac * self.maxalt)))))
+        return r, inner, left, right, top, bottom, width, height, ticklist
+
+    def _render_background(self, r, inner, left, right, top, bottom, width, height, ticklist):
+        # Panel, track, ticks and title only change with the widget size
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(r.size() * dpr)
+        pix.setDevicePixelRatio(dpr)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.fillRect(r, self._bg_color)
+        p.setPen(self._panel_pen)
+        p.setBrush(self._panel_brush)
+        p.drawRoundedRect(inner, 12, 12)
 
-        p.setBrush(QBrush(QColor("#ededed")))
-        p.setPen(QPen(QColor("#cccccc"), 1.0))
+        p.setBrush(self._track_brush)
+        p.setPen(self._track_pen)
         p.drawRoundedRect(left, top, width, height, 8, 8)
 
+        p.setPen(self._text_pen)
+        p.setFont(self._tick_font)
+        for y, label in ticklist:
+            p.drawLine(right+6, y, right+20, y)
+            p.drawText(right+24, y-8, 40, 16, Qt.AlignLeft | Qt.AlignVCenter, label)
+        p.setFont(self.titlefont)
+        p.drawText(left, inner.top()+6, width, 20, Qt.AlignCenter, "Altitude")
+        p.end()
+        return pix
+
+    def paintEvent(self, event):
+        if self._geom is None:
+            self._geom = self._build_geometry()
+        r, inner, left, right, top, bottom, width, height, ticklist = self._geom
+        if self._bg_cache is None:
+            self._bg_cache = self._render_background(*self._geom)
+
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.drawPixmap(0, 0, self._bg_cache)
+
         ratio = self.alt/self.maxalt if self.maxalt else 0
         fillh = max(6, height*ratio)
         filly = bottom - fillh
-        grad = QLinearGradient(left, filly, left, bottom)
-        grad.setColorAt(0.0, QColor("#4fd2ff"))
-        grad.setColorAt(1.0, QColor("#006b96"))
-        p.setBrush(QBrush(grad))
+        grad = self._fill_grad
+        grad.setStart(left, filly)
+        grad.setFinalStop(left, bottom)
+        p.setBrush(grad)
         p.setPen(Qt.NoPen)
         drawh = fillh - 6 if fillh > 12 else fillh
         p.drawRoundedRect(left+6, filly+6, width-12, drawh, 6, 6)
 
-        p.setPen(QPen(QColor("#111111")))
-        p.setFont(QFont("Consolas", 9))
-        ticks = 6
-        for i in range(ticks):
-            frac = i / (ticks-1)
-            y = bottom - frac*height
-            p.drawLine(right+6, int(y), right+20, int(y))
-            val = int(round(frac * self.maxalt))
-            p.drawText(right+24, int(y)-8, 40, 16, Qt.AlignLeft | Qt.AlignVCenter, str(val))
+        if not self._rocket_loaded:
+            self._rocket_loaded = True
+            if self.rocketpath and os.path.exists(self.rocketpath):
+                self.rocket = QPixmap(self.rocketpath)
         if self.rocket:
             rpw = min(36, int(width*0.5))
             rph = rpw
+            if self._rocket_scaled is None:
+                # Scale at device resolution so HiDPI screens get a sharp blit
+                dpr = self.devicePixelRatioF()
+                self._rocket_scaled = self.rocket.scaled(int(rpw*dpr), int(rph*dpr), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                self._rocket_scaled.setDevicePixelRatio(dpr)
             rockety = int(bottom - fillh - rph/2)
             rocketx = int(left + width/2 - rpw/2)
             rockety = max(top+4, min(rockety, bottom - rph - 4))
-            p.drawPixmap(rocketx, rockety, rpw, rph, self.rocket)
-        p.setPen(QPen(QColor("#111111")))
-        p.setFont(self.titlefont)
-        p.drawText(left, inner.top()+6, width, 20, Qt.AlignCenter, "Altitude")
+            p.drawPixmap(rocketx, rockety, self._rocket_scaled)
+        p.setPen(self._text_pen)
         p.setFont(self.valuefont)
         p.drawText(left, inner.bottom()-34, width, 28, Qt.AlignCenter, f"{int(self.alt)} m")
         p.end()
 
+def bgrimage(framebgr):
+    """Wrap an OpenCV BGR frame as a QImage without converting or copying pixels."""
+    frame = np.ascontiguousarray(framebgr)
+    h, w = frame.shape[:2]
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888)
+
+class FrameWorker(QObject):
+    """Scales camera frames off the GUI thread."""
+    frameReady = Signal(int, QImage)
+
+    @Slot(int, object, QSize)
+    def process(self, camindex, framebgr, size):
+        try:
+            src = bgrimage(framebgr)
+            img = src.scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation)
+            # scaled() shares src when the size is unchanged; detach from the numpy buffer
+            if img.size() == src.size():
+                img = src.copy()
+        except Exception:
+            # A null image is dropped by the receiver
+            img = QImage()
+        self.frameReady.emit(camindex, img)
+
+def _stop_thread(thread):
+    try:
+        thread.quit()
+        thread.wait()
+    except RuntimeError:
+        # Underlying QThread already deleted with its parent
+        pass
+
+class FrameLabel(QLabel):
+    """QLabel that paints the latest camera QImage directly, without a QPixmap copy."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._img = None
+
+    def frame(self):
+        return self._img
+
+    def setFrame(self, img):
+        if self._img is None and not self.pixmap().isNull():
+            super().setPixmap(QPixmap())
+        self._img = img
+        self.update()
+
+    def setPixmap(self, pix):
+        self._img = None
+        super().setPixmap(pix)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        img = self._img
+        if img is None or img.isNull():
+            return
+        # Aspect fit, centred; drawImage scales straight onto the target surface
+        size = img.size().scaled(self.size(), Qt.KeepAspectRatio)
+        target = QRect(0, 0, size.width(), size.height())
+        target.moveCenter(self.rect().center())
+        p = QPainter(self)
+        p.drawImage(target, img)
+        p.end()
+
+CAMERABOX_QSS = """
+    QFrame#cameraBox, QFrame#cameraBox QFrame {background:#f2f2f2; border:1px solid #cfcfcf; border-radius:10px;}
+    QFrame#cameraBox QLabel[objectName=title] {color:#111111; font:10pt "Segoe UI";padding-left:6px;}
+    QFrame#cameraBox QLabel[objectName=view] {background:#000;border-radius:8px;}
+    QFrame#cameraBox QPushButton {background:transparent; color:#333; border:1px solid #bdbdbd; border-radius:6px; padding:2px;}
+    QFrame#cameraBox QPushButton:hover {background:#e0e0e0;}
+"""
+
 class CameraBox(QFrame):
     def __init__(self, title="Camera", parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QFrame {background:#f2f2f2; border:1px solid #cfcfcf; border-radius:10px;}
-            QLabel[objectName=title] {color:#111111; font:10pt "Segoe UI";padding-left:6px;}
-            QLabel[objectName=view] {background:#000;border-radius:8px;}
-            QPushButton {background:transparent; color:#333; border:1px solid #bdbdbd; border-radius:6px; padding:2px;}
-            QPushButton:hover {background:#e0e0e0;}
-        """)
+        # Styled by CAMERABOX_QSS, applied once on the container
+        self.setObjectName("cameraBox")
         self.setMinimumSize(320,220)
         self.currentfile = None
+        # Latest frame; _qimg views its memory, so both are kept together
+        self._frame = None
+        self._qimg = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8,8,8,8)
@@ -180,7 +413,7 @@ class CameraBox(QFrame):
         titlelbl.setFixedHeight(22)
         layout.addWidget(titlelbl)
 
-        self.view = QLabel()
+        self.view = FrameLabel()
         self.view.setObjectName("view")
         self.view.setMinimumSize(300, 160)
         self.view.setAlignment(Qt.AlignCenter)
@@ -224,22 +457,28 @@ class CameraBox(QFrame):
         ctrlrow.addWidget(self.expandbtn)
         layout.addLayout(ctrlrow)
 
+        # Multimedia backends are created on first upload, not per box at startup
         self.player = None
         self.audiooutput = None
         self.videowidget = None
-        if USE_MULTIMEDIA:
-            try:
-                self.player = QMediaPlayer(self)
-                self.audiooutput = QAudioOutput(self)
-                self.player.setAudioOutput(self.audiooutput)
-                self.videowidget = QVideoWidget(self)
-                self.videowidget.setMinimumSize(300, 160)
-                self.videowidget.setStyleSheet("background:#000;")
-                self.player.setVideoOutput(self.videowidget)
-            except Exception:
-                self.player = None
-                self.audiooutput = None
-                self.videowidget = None
+
+    def _ensure_player(self):
+        if self.player is not None or not USE_MULTIMEDIA:
+            return
+        try:
+            # A QAudioOutput serves one player at a time, so each box owns its own
+            self.audiooutput = QAudioOutput(self)
+            self.player = QMediaPlayer(self)
+            self.player.setAudioOutput(self.audiooutput)
+            self.videowidget = QVideoWidget(self)
+            self.videowidget.setMinimumSize(300, 160)
+            self.videowidget.setStyleSheet("background:#000;")
+            self.videowidget.hide()
+            self.player.setVideoOutput(self.videowidget)
+        except Exception:
+            self.player = None
+            self.audiooutput = None
+            self.videowidget = None
 
     @silent
     def onupload(self):
@@ -247,6 +486,7 @@ class CameraBox(QFrame):
         if not file:
             return
         self.currentfile = file
+        self._ensure_player()
         if self.player and self.videowidget:
             parentlayout = self.layout()
             idx = parentlayout.indexOf(self.view)
@@ -285,19 +525,20 @@ class CameraBox(QFrame):
             self.player.stop()
             QTimer.singleShot(100, lambda: self.player.play())
 
-    @silent
     def updateframe(self, framebgr):
-        if not HAS_CV2 or framebgr is None:
+        if framebgr is None or getattr(framebgr, "ndim", 0) != 3:
             blank = QPixmap(self.view.size())
             blank.fill(QColor("#000"))
             self.view.setPixmap(blank)
             return
-        h, w = framebgr.shape[:2]
-        rgb = cv2.cvtColor(framebgr, cv2.COLOR_BGR2RGB)
-        bytesperline = 3 * w
-        qimg = QImage(rgb.data, w, h, bytesperline, QImage.Format_RGB888)
-        pix = QPixmap.fromImage(qimg).scaled(self.view.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.view.setPixmap(pix)
+        self._frame = np.ascontiguousarray(framebgr)
+        self._qimg = bgrimage(self._frame)
+        self.view.setFrame(self._qimg)
+
+    def _on_image_ready(self, img):
+        if img.isNull():
+            return
+        self.view.setFrame(img)
 
     @silent
     def openexpanded(self):
@@ -320,7 +561,9 @@ class CameraBox(QFrame):
         else:
             label = QLabel()
             label.setAlignment(Qt.AlignCenter)
-            if self.view.pixmap():
+            if self.view.frame() is not None:
+                label.setPixmap(QPixmap.fromImage(self.view.frame()).scaled(800, 600, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            elif self.view.pixmap():
                 label.setPixmap(self.view.pixmap().scaled(800, 600, Qt.KeepAspectRatio, Qt.SmoothTransformation))
             else:
                 empty = QPixmap(800, 600)
@@ -331,24 +574,46 @@ class CameraBox(QFrame):
             dlg.exec()
 
 class CockpitWidget(QWidget):
+    _framePosted = Signal(int, object, QSize)
+
+    PANEL_QSS = "QFrame{background:#f2f2f2; border-radius:10px; border:1px solid #cfcfcf;}"
+    INV_9 = 1/9.0
+    INV_8 = 1/8.0
+    # Display precision per gauge key; values are compared after rounding.
+    # Altitude is left to AltitudeCylinder.setAltitude, which truncates.
+    FLUSH_DIGITS = {"t": 1, "p": 1, "a": 2}
+
     def __init__(self, parent=None, rocketpath=None, telemetrycsv=None):
         super().__init__(parent)
         self.setStyleSheet("background:#f2f2f2; color:#111111; font-family:Segoe UI;")
         self.rocketpath = rocketpath
         self.telemetrycsv = telemetrycsv
+        self._pending = {}
+        self._dirty = set()
+        self._last = {}
         self.initui()
         self.csvrows = []
         self.csvindex = 0
+        # Synthetic demo state when no CSV is loaded
+        self._t, self._p, self._a, self._alt = 15.0, 1013.25, 0.0, 100.0
+        # Parsed on the thread pool; demo data plays until the rows arrive
+        self._csvloader = None
         if self.telemetrycsv and os.path.exists(self.telemetrycsv):
-            try:
-                with open(self.telemetrycsv, "r", newline="") as f:
-                    reader = csv.DictReader(f)
-                    self.csvrows = list(reader)
-            except Exception as e:
-                print("Failed to read telemetry CSV:", e)
+            self._csvloader = CsvLoader(self.telemetrycsv)
+            self._csvloader.signals.loaded.connect(self._on_csv_loaded)
+            QThreadPool.globalInstance().start(self._csvloader)
+        self._frames_inflight = set()
+        self._frame_thread = None
+        self._frame_worker = None
+        # Timers only run while the cockpit is shown; see showEvent/hideEvent
+        self._live = False
         self.demotimer = QTimer(self)
+        self.demotimer.setInterval(300)
         self.demotimer.timeout.connect(self.demotick)
-        self.demotimer.start(300)
+        # Telemetry only marks values dirty; gauges repaint at the render rate
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(100)
+        self._render_timer.timeout.connect(self._flush)
 
     def initui(self):
         scroll = QScrollArea()
@@ -362,8 +627,8 @@ class CockpitWidget(QWidget):
         grid.setContentsMargins(12, 8, 12, 8)
         grid.setHorizontalSpacing(18)
         grid.setVerticalSpacing(12)
-        # Plotly/Simple Gauges left
-        self.createplotlygauges()
+        # Gauges left
+        self.creategauges()
         leftv = QVBoxLayout()
         leftv.setSpacing(12)
         leftv.addWidget(self.wrappanel(self.gtempview, "Temperature"))
@@ -381,6 +646,7 @@ class CockpitWidget(QWidget):
         for cam in self.cameraboxes:
             rightv.addWidget(cam)
         rightwidget = QWidget()
+        rightwidget.setStyleSheet(CAMERABOX_QSS)
         rightwidget.setLayout(rightv)
         self.alt = AltitudeCylinder(maxalt=1500, rocketpath=self.rocketpath)
         grid.addWidget(leftwidget, 0, 0)
@@ -396,7 +662,7 @@ class CockpitWidget(QWidget):
     def wrappanel(self, widget, labeltext):
         frame = QFrame()
         frame.setFrameShape(QFrame.StyledPanel)
-        frame.setStyleSheet("QFrame{background:#f2f2f2; border-radius:10px; border:1px solid #cfcfcf;}")
+        frame.setStyleSheet(self.PANEL_QSS)
         layout = QHBoxLayout(frame)
         layout.setContentsMargins(8,8,8,8)
         layout.addWidget(widget, 4)
@@ -407,76 +673,151 @@ class CockpitWidget(QWidget):
         frame.label = lbl
         return frame
 
-    def createplotlygauges(self):
-        t0, p0, a0 = 20.0, 1013.25, 0.0
-        textcolor = "#111111"
-        self.gtemphtml = make_plotly_gauge_html("Temperature (C)", -50, 150, t0, barcolor="#FF7043", textcolor=textcolor)
-        self.gpreshtml = make_plotly_gauge_html("Pressure (Pa)", 800, 1200, p0, barcolor="#42A5F5", textcolor=textcolor)
-        self.gaccelhtml = make_plotly_gauge_html("Acceleration (m/s²)", 0, 20, a0, barcolor="#66BB6A", textcolor=textcolor)
-        if HAS_WEBENGINE:
-            self.gtempview = QWebEngineView()
-            self.gtempview.setHtml(self.gtemphtml, QUrl("about:blank"))
-            self.gtempview.setMinimumSize(320,180)
-            self.gpresview = QWebEngineView()
-            self.gpresview.setHtml(self.gpreshtml, QUrl("about:blank"))
-            self.gpresview.setMinimumSize(320,180)
-            self.gaccelview = QWebEngineView()
-            self.gaccelview.setHtml(self.gaccelhtml, QUrl("about:blank"))
-            self.gaccelview.setMinimumSize(320,180)
-        else:
-            def simplelabel(txt):
-                l = QLabel(txt)
-                l.setFixedHeight(180)
-                l.setAlignment(Qt.AlignCenter)
-                l.setStyleSheet("background:#e8e8e8; border-radius:8px; color:#111111;")
-                return l
-            self.gtempview = simplelabel("Temperature\nPlotly missing")
-            self.gpresview = simplelabel("Pressure\nPlotly missing")
-            self.gaccelview = simplelabel("Acceleration\nPlotly missing")
+    def update_camera_frame(self, camindex, framebgr):
+        """Queue a BGR frame for camera box camindex; conversion runs on the worker thread."""
+        if camindex < 0 or camindex >= len(self.cameraboxes):
+            return
+        if framebgr is not None:
+            self._ensure_frame_worker()
+        if self._frame_worker is None or framebgr is None:
+            self.cameraboxes[camindex].updateframe(framebgr)
+            return
+        # Drop frames while the previous one for this camera is still in flight
+        if camindex in self._frames_inflight:
+            return
+        self._frames_inflight.add(camindex)
+        self._framePosted.emit(camindex, framebgr, self.cameraboxes[camindex].view.size())
 
-    @silent
-    def updateplotlyview(self, webview, value):
-        if not HAS_WEBENGINE or webview is None:
+    def _on_frame_ready(self, camindex, img):
+        self._frames_inflight.discard(camindex)
+        self.cameraboxes[camindex]._on_image_ready(img)
+
+    def _ensure_frame_worker(self):
+        # Started on the first frame so a cockpit without cameras owns no thread
+        if self._frame_thread is not None:
             return
-        js = f"window.updateGauge({float(value)})"
-        webview.page().runJavaScript(js)
+        thread = QThread(self)
+        self._frame_worker = FrameWorker()
+        self._frame_worker.moveToThread(thread)
+        self._framePosted.connect(self._frame_worker.process)
+        self._frame_worker.frameReady.connect(self._on_frame_ready)
+        thread.start()
+        self._frame_thread = thread
+        # destroyed fires before the QThread child is deleted; self is gone by
+        # then, so the slot only holds the thread
+        self.destroyed.connect(lambda *_: _stop_thread(thread))
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_frame_worker)
+
+    def _stop_frame_worker(self):
+        # The stopped thread is kept so a late frame can't start another one
+        if self._frame_thread is not None:
+            _stop_thread(self._frame_thread)
+
+    def creategauges(self):
+        self._gauges = {key: QtGauge(*spec) for key, spec in GAUGE_SPECS.items()}
+        self.gtempview = self._gauges["t"]
+        self.gpresview = self._gauges["p"]
+        self.gaccelview = self._gauges["a"]
+
+    def updategauge(self, gauge, value):
+        if gauge is None:
+            return
+        gauge.setValue(value)
 
-    @silent
     def demotick(self):
         # If CSV available, play rows; otherwise, step demo mode
         if self.csvrows:
-            row = self.csvrows[self.csvindex % len(self.csvrows)]
-            self.updateFromRow(row)
+            self._update_telemetry(*self.csvrows[self.csvindex % len(self.csvrows)])
             self.csvindex = (self.csvindex + 1) % len(self.csvrows)
         else:
-            if not hasattr(self, "demostate"):
-                self.demostate = {"t":15.0, "p":1013.25, "a":0.0, "alt":100.0}
-            s = self.demostate
-            s["t"] = max(-20, min(120, s["t"] + 0.3))
-            s["p"] = 900 + 50*math.sin(s["t"]/9.0)
-            s["a"] = abs(math.sin(s["t"]/8.0))*8.0
-            s["alt"] = min(1500, s["alt"] + 2.2)
-            row = {
-                "TempC": s["t"],
-                "PressurePa": s["p"],
-                "Accelms2": s["a"],
-                "Altitudem": s["alt"],
-            }
-            self.updateFromRow(row)
+            t = max(-20, min(120, self._t + 0.3))
+            # Once t is clamped the waveforms stop moving; skip the trig
+            if t != self._t:
+                self._t = t
+                self._p = 900 + 50*math.sin(t*self.INV_9)
+                self._a = abs(math.sin(t*self.INV_8))*8.0
+            self._alt = min(1500, self._alt + 2.2)
+            self._update_telemetry(t, self._p, self._a, self._alt)
+
+    def _on_csv_loaded(self, rows):
+        self._csvloader = None
+        self.csvrows = rows
+        self.csvindex = 0
+
+    def _update_telemetry(self, t=None, p=None, a=None, alt=None):
+        pending = self._pending
+        dirty = self._dirty
+        if t is not None:
+            pending["t"] = t
+            dirty.add("t")
+        if p is not None:
+            pending["p"] = p
+            dirty.add("p")
+        if a is not None:
+            pending["a"] = a
+            dirty.add("a")
+        if alt is not None:
+            pending["alt"] = alt
+            dirty.add("alt")
 
-    @silent
     def updateFromRow(self, row):
-        try:
-            if "TempC" in row and row["TempC"] not in (None, ""):
-                self.updateplotlyview(self.gtempview, float(row["TempC"]))
-            if "PressurePa" in row and row["PressurePa"] not in (None, ""):
-                self.updateplotlyview(self.gpresview, float(row["PressurePa"]))
-            if "Accelms2" in row and row["Accelms2"] not in (None, ""):
-                self.updateplotlyview(self.gaccelview, float(row["Accelms2"]))
-            if "Altitudem" in row and row["Altitudem"] not in (None, ""):
-                self.alt.setAltitude(float(row["Altitudem"]))
-        except Exception as e:
-            print("updateFromRow error", e)
+        # Missing or malformed fields come back as None and are skipped
+        self._update_telemetry(*(_rowfloat(row, c) for c in TELEMETRY_COLUMNS))
+
+    @Slot(dict)
+    def update_telemetry(self, row):
+        """Push a live telemetry row; the first usable row stops demo/CSV playback."""
+        values = [_rowfloat(row, c) for c in TELEMETRY_COLUMNS]
+        if all(v is None for v in values):
+            return
+        if not self._live:
+            self.set_live(True)
+        self._update_telemetry(*values)
+
+    def set_live(self, live):
+        """Switch between a live feed and demo/CSV playback, which resumes when live ends."""
+        if live == self._live:
+            return
+        self._live = live
+        if live:
+            self.demotimer.stop()
+        elif self.isVisible():
+            self.demotimer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._live:
+            self.demotimer.start()
+        self._render_timer.start()
+        self._flush()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.demotimer.stop()
+        self._render_timer.stop()
+
+    def _flush(self):
+        # Values stay dirty while hidden and are painted on the next show
+        if not self._dirty or not self.isVisible():
+            return
+        for key in self._dirty:
+            v = self._pending[key]
+            if key == "alt":
+                self.alt.setAltitude(v)
+                continue
+            shown = round(v, self.FLUSH_DIGITS[key])
+            if self._last.get(key) == shown:
+                continue
+            self._last[key] = shown
+            self.updategauge(self._gauges[key], v)
+        self._dirty.clear()
+
+    def set_update_rate(self, hz):
+        """Set how many times per second pending telemetry is painted."""
+        hz = max(0.1, float(hz))
+        self._render_timer.setInterval(int(1000 / hz))
 
 class CockpitFloatingWindow(QDialog):
     def __init__(self, parent=None, rocketpath=None, telemetrycsv=None):
@@ -499,6 +840,13 @@ class CockpitFloatingWindow(QDialog):
     def updateFromRow(self, row):
         self.cockpit.updateFromRow(row)
 
+    @Slot(dict)
+    def update_telemetry(self, row):
+        self.cockpit.update_telemetry(row)
+
+    def set_live(self, live):
+        self.cockpit.set_live(live)
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     rocket_default = "rCTT.png" if os.path.exists("rCTT.png") else None
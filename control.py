@@ -6,14 +6,19 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal   # ✅ Added Signal import
 from PySide6.QtGui import QFont, QPixmap, QColor
 import os
+import logging
+
+log = logging.getLogger(__name__)
 
 
 class LoginWindow(QWidget):
     login_successful = Signal()   # ✅ Added signal
+    # Launch codes, stored lowercased; input is matched case-insensitively
+    _ALLOWED = frozenset({"rudra"})
 
     def __init__(self):
         super().__init__()
-        print("Initializing LoginWindow UI")
+        log.debug("Initializing LoginWindow UI")
         self.setWindowTitle("RUDRA Login")
         self.setGeometry(400, 300, 420, 540)
         self.setStyleSheet("""
@@ -87,27 +92,24 @@ class LoginWindow(QWidget):
         self.setLayout(layout)
 
     def check_login(self):
-        print("Check login triggered")
+        log.debug("Check login triggered")
         self.loginbtn.setEnabled(False)
         self.input.setEnabled(False)
-        allowed_passwords = ["rudra", "RUDRA", "Rudra"]
         try:
-            if any(self.input.text().lower() == p.lower() for p in allowed_passwords):
-                print("Login successful → emitting signal to main")
+            if self.input.text().strip().lower() in self._ALLOWED:
+                log.debug("Login successful, emitting signal to main")
                 self.login_successful.emit()  # ✅ emit signal to main.py
                 self.close()
             else:
-                print("Login failed: Incorrect Launch Code")
+                log.info("Login failed: incorrect launch code")
                 QMessageBox.warning(self, "Access Denied", "Incorrect Launch Code")
                 self.loginbtn.setEnabled(True)
                 self.input.setEnabled(True)
                 self.input.clear()
                 self.input.setFocus()
         except Exception as e:
-            import traceback
             error_message = f"Failed during login:\n{str(e)}"
-            print("Exception in check_login:", e)
-            print(traceback.format_exc())
+            log.exception("Exception in check_login")
             QMessageBox.critical(self, "Error", error_message)
             self.loginbtn.setEnabled(True)
             self.input.setEnabled(True)
@@ -3,16 +3,14 @@ from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QFrame, QLabel, QPushButton,
     QSizePolicy, QTextEdit
 )
-from PySide6.QtCore import Qt, QTimer, QTime, Signal, QPoint
-from PySide6.QtGui import QFont, QCursor, QPixmap
+from PySide6.QtCore import Qt, QTimer, Signal, QPoint, QEvent
+from PySide6.QtGui import QFont, QCursor, QPixmap, QPixmapCache
 import os
+import logging
 
 # --- Internal Imports (safe ones only) ---
 from telemetry1 import TelemetryPanel
 from mission_stagebar import MissionStageBar
-from tabs.controltab import ControlTab
-from tabs.visualtab import VisualTab
-from tabs.systemdials import SystemDialsTab
 from tabs.csvtab import CSVTab
 from tabs.logtab import LogTab
 from cockpit_tab import CockpitWidget, CockpitFloatingWindow
@@ -22,8 +20,88 @@ from inputsourcedialog import InputSourceDialog
 from serial_preprocessor import XBeeTelemetryWorker  # live parser
 
 
+log = logging.getLogger(__name__)
+
+# Shipped next to this module, so the logo loads wherever the repo is checked out
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "Home.png")
+
+def _get_logo(path, size=38):
+    """Decoded, scaled logo from Qt's shared QPixmapCache; null if the file is missing."""
+    key = f"logo:{path}@{size}"
+    pix = QPixmap()
+    if QPixmapCache.find(key, pix):
+        return pix
+    if not os.path.exists(path):
+        return QPixmap()
+    pix = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, pix)
+    return pix
+
+# Top bar fonts, resolved once
+FONT_BAR_BOLD16 = QFont("Segoe UI", 16, QFont.Weight.Bold)
+FONT_BAR_BOLD10 = QFont("Segoe UI", 10, QFont.Weight.Bold)
+FONT_BAR_12 = QFont("Segoe UI", 12)
+
+# Top bar look, shared by both themes; rules are scoped by object name so
+# the window carries a single sheet
+_TOPBAR_QSS = """
+    QFrame#topbar, QFrame#topbar QFrame { background: #f2f3f5; border-radius: 16px; margin: 5px; }
+    QFrame#btnbox, QFrame#btnbox QFrame, QFrame#logobox, QFrame#logobox QFrame { background: transparent; border: none; }
+    QFrame#btnbox QPushButton {
+        background: #e9e9ef;
+        border: none;
+        border-radius: 12px;
+        padding: 8px 20px;
+        color: #232a35;
+        font-weight: bold;
+        font-size: 15px;
+    }
+    QFrame#btnbox QPushButton:hover { background: #d9dae3; color: #19305a; }
+    QFrame#logobox QLabel#namelabel { color:#232a35; background:#f2f3f5; padding:6px 14px; border-radius:10px; }
+    QFrame#topbar QLabel#inputstatus { color:#17a2b8; background-color:rgba(0,0,0,0.18); padding:6px 10px; border-radius:11px; }
+    QFrame#topbar QLabel#timerlabel { color:#3498db; background-color:rgba(0,0,0,0.13); padding:7px 17px; border-radius:13px; }
+"""
+
+LIGHT_QSS = _TOPBAR_QSS
+
+DARK_QSS = """
+    QMainWindow, QWidget { background: #232b2b; color: #e7eaf3; }
+    QTabWidget::pane { background: #292e38; }
+    QTabBar::tab { background: #444; color: #fafbfc; }
+    QTabBar::tab:selected { background: #298af8; }
+    QFrame { background: #22282b; }
+    QPushButton, QLineEdit, QLabel { background: #333942; border: 1px solid #444; color: #e3eaf3; }
+""" + _TOPBAR_QSS
+
+
+class _TopBarButton(QPushButton):
+    """Top bar pill button; sizing lives here instead of a per-button loop."""
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setMinimumHeight(36)
+        self.setMaximumHeight(40)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+
 class MainDashboardWindow(QMainWindow):
     inputsourcechanged = Signal(str, object)
+    ROW_FLUSH_MS = 40
+    XBEE_DRAIN_MS = 30
+    # Health glyph sheets for nominal / warning / critical
+    # Parsed once; a level change only flips the "hl" property and repolishes
+    _HEALTH_QSS = (
+        "QLabel { background:transparent; font-size:16px; }"
+        "QLabel[hl='ok'] { color:#2ecc71; }"
+        "QLabel[hl='warn'] { color:#f1c40f; }"
+        "QLabel[hl='bad'] { color:#e74c3c; }"
+    )
+    _HEALTH_LEVELS = ("ok", "warn", "bad")
+    # Top bar status text per input source id
+    _STATUS_FMT = {
+        "csv": "Input Source: CSV File\n{}",
+        "xbee_serial": "Input Source: XBee ({})",
+        "xbee_wired": "Input Source: XBee ({})",
+    }
 
     def __init__(self):
         super().__init__()
@@ -33,33 +111,54 @@ class MainDashboardWindow(QMainWindow):
         self.active_input_source = None
         self.active_input_details = None
         self.preproc = None
+        self._input_dialog = None
 
         # references used for alignment
         self.topbar = None
         self.timerlabel = None
         self.health_strip = None
         self.health_icon = None
+        self._last_icon_pos = None
         self.logtab = None
 
+        # Telemetry rows are buffered and fanned out at most every ROW_FLUSH_MS
+        self._pending_rows = []
+        self._row_flush_timer = QTimer(self)
+        self._row_flush_timer.setSingleShot(True)
+        self._row_flush_timer.setInterval(self.ROW_FLUSH_MS)
+        self._row_flush_timer.timeout.connect(self._flush_rows)
+        # Polls the XBee worker's row queue while a serial source is active
+        self._xbee_drain_timer = QTimer(self)
+        self._xbee_drain_timer.setInterval(self.XBEE_DRAIN_MS)
+        self._xbee_drain_timer.timeout.connect(self._drain_preproc)
+
         self.init_ui()
 
     # ---------------------------
     # MAIN UI SETUP (minimal edits only)
     # ---------------------------
     def init_ui(self):
+        # Build the whole tree with repaints off; one pass when re-enabled
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
         self.telemetrypanel = TelemetryPanel()
 
+        # Pages that only render on demand start as placeholders and are
+        # built on first selection; see _materialize_page
         self.pagestack = QStackedWidget()
-        self.pagestack.addWidget(ControlTab())
-        self.pagestack.addWidget(VisualTab())
-        self.pagestack.addWidget(SystemDialsTab())
-        try:
-            from tabs.gpstab import GPSTab
-            gps_tab = GPSTab()
-        except Exception as e:
-            print("❌ GPSTab init error:", e)
-            gps_tab = QWidget()
-        self.pagestack.addWidget(gps_tab)
+        self._stack_factories = {
+            0: self._make_control_tab,
+            1: self._make_visual_tab,
+            2: self._make_dials_tab,
+            3: self._make_gps_tab,
+        }
+        for _ in self._stack_factories:
+            self.pagestack.addWidget(QWidget())
         self.csvtab = CSVTab()
         self.pagestack.addWidget(self.csvtab)
 
@@ -75,7 +174,7 @@ class MainDashboardWindow(QMainWindow):
             from tabs.plottab import PlotTab
             self.plottab = PlotTab()
         except Exception as e:
-            print("❌ PlotTab init error:", e)
+            log.error("PlotTab init error: %s", e)
             self.plottab = QWidget()
 
         self.maintabs = QTabWidget()
@@ -84,7 +183,7 @@ class MainDashboardWindow(QMainWindow):
         self.cockpit_widget = CockpitWidget()
         self.maintabs.addTab(self.cockpit_widget, "COCKPIT")
         self.maintabs.addTab(self.plottab, "PLOT")
-        self.maintabs.addTab(GalleryTab(), "GALLERY")
+        self._tab_factories = {self.maintabs.addTab(QWidget(), "GALLERY"): ("GALLERY", GalleryTab)}
 
         self.summarytab = QTextEdit()
         self.summarytab.setReadOnly(True)
@@ -93,52 +192,39 @@ class MainDashboardWindow(QMainWindow):
 
         # ------------------ Top Bar (alignment polish only) ------------------
         self.topbar = QFrame()
+        self.topbar.setObjectName("topbar")
         self.topbar.setFixedHeight(70)
-        self.topbar.setStyleSheet("QFrame { background: #f2f3f5; border-radius: 16px; margin: 5px; }")
         toplayout = QHBoxLayout(self.topbar)
         toplayout.setContentsMargins(12, 5, 16, 5)
         toplayout.setSpacing(16)
 
         # Button group; remove container background so pills float cleanly
         btnbox = QFrame()
-        btnbox.setStyleSheet("QFrame { background: transparent; border: none; }")
+        btnbox.setObjectName("btnbox")
         btnrow = QHBoxLayout(btnbox)
         btnrow.setContentsMargins(0, 0, 0, 0)
         btnrow.setSpacing(10)
 
-        pill = """
-            QPushButton {
-                background: #e9e9ef;
-                border: none;
-                border-radius: 12px;
-                padding: 8px 20px;
-                color: #232a35;
-                font-weight: bold;
-                font-size: 15px;
-            }
-            QPushButton:hover { background: #d9dae3; color: #19305a; }
-        """
-        self.homebtn  = QPushButton("HOME");  self.homebtn.setStyleSheet(pill);  self.homebtn.clicked.connect(self.show_home_tabs)
-        self.themebtn = QPushButton("THEME"); self.themebtn.setCheckable(True);  self.themebtn.setStyleSheet(pill); self.themebtn.clicked.connect(self.toggle_theme)
-        self.corebtn  = QPushButton("CORE");  self.corebtn.setStyleSheet(pill);  self.corebtn.clicked.connect(self.toggle_cockpit_window)
-        self.inputbtn = QPushButton("INPUT"); self.inputbtn.setStyleSheet(pill); self.inputbtn.clicked.connect(self.open_input_source_dialog)
+        # Pill style comes from the QFrame#btnbox rules in _TOPBAR_QSS
+        self.homebtn  = _TopBarButton("HOME");  self.homebtn.clicked.connect(self.show_home_tabs)
+        self.themebtn = _TopBarButton("THEME"); self.themebtn.setCheckable(True);  self.themebtn.clicked.connect(self.toggle_theme)
+        self.corebtn  = _TopBarButton("CORE");  self.corebtn.clicked.connect(self.toggle_cockpit_window)
+        self.inputbtn = _TopBarButton("INPUT"); self.inputbtn.clicked.connect(self.open_input_source_dialog)
         for b in (self.homebtn, self.themebtn, self.corebtn, self.inputbtn):
-            b.setMinimumHeight(36); b.setMaximumHeight(40); b.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             btnrow.addWidget(b)
         toplayout.addWidget(btnbox, 0, Qt.AlignVCenter)
 
         # Logo + Title in one compact block
         self.logolabel = QLabel()
-        logopath = "C:/MERN_TT/assets/Home.png"
-        if os.path.exists(logopath):
-            self.logolabel.setPixmap(QPixmap(logopath).scaled(38, 38, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo = _get_logo(LOGO_PATH)
+        if not logo.isNull():
+            self.logolabel.setPixmap(logo)
         self.logolabel.setCursor(QCursor(Qt.PointingHandCursor))
         self.logolabel.setFixedSize(40, 40)
 
         namelabel = QLabel("RUDRA GROUNDSTATION")
-        namelabel.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        # remove heavy border; keep subtle pad to stop clipping
-        namelabel.setStyleSheet("color:#232a35; background:#f2f3f5; padding:6px 14px; border-radius:10px;")
+        namelabel.setObjectName("namelabel")
+        namelabel.setFont(FONT_BAR_BOLD16)
 
         logo_row = QHBoxLayout()
         logo_row.setContentsMargins(0, 0, 0, 0)
@@ -146,7 +232,7 @@ class MainDashboardWindow(QMainWindow):
         logo_row.addWidget(self.logolabel, 0, Qt.AlignVCenter)
         logo_row.addWidget(namelabel, 0, Qt.AlignVCenter)
         logo_box = QFrame()
-        logo_box.setStyleSheet("QFrame { background: transparent; border: none; }")
+        logo_box.setObjectName("logobox")
         logo_box.setLayout(logo_row)
         toplayout.addWidget(logo_box, 0, Qt.AlignVCenter)
         self.logolabel.mousePressEvent = self.toggle_admin_tab_hidden
@@ -154,13 +240,13 @@ class MainDashboardWindow(QMainWindow):
         toplayout.addStretch(1)
 
         self.inputstatus = QLabel("Input Source: [not selected]")
-        self.inputstatus.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        self.inputstatus.setStyleSheet("color:#17a2b8; background-color:rgba(0,0,0,0.18); padding:6px 10px; border-radius:11px;")
+        self.inputstatus.setObjectName("inputstatus")
+        self.inputstatus.setFont(FONT_BAR_BOLD10)
         toplayout.addWidget(self.inputstatus, 0, Qt.AlignVCenter)
 
         self.timerlabel = QLabel("Mission Time 00:00")
-        self.timerlabel.setFont(QFont("Segoe UI", 12))
-        self.timerlabel.setStyleSheet("color:#3498db; background-color:rgba(0,0,0,0.13); padding:7px 17px; border-radius:13px;")
+        self.timerlabel.setObjectName("timerlabel")
+        self.timerlabel.setFont(FONT_BAR_12)
         toplayout.addWidget(self.timerlabel, 0, Qt.AlignVCenter)
 
         # ------------------ Central Layout ------------------
@@ -177,20 +263,24 @@ class MainDashboardWindow(QMainWindow):
         self.health_strip.setStyleSheet("QFrame { background: transparent; }")
         # icon inside strip; no background; mouse-transparent; always visible
         self.health_icon = QLabel("⚡", parent=self.health_strip)
-        self.health_icon.setStyleSheet("color:#2ecc71; background:transparent; font-size:16px;")
+        self.health_icon.setProperty("hl", self._HEALTH_LEVELS[0])
+        self.health_icon.setStyleSheet(self._HEALTH_QSS)
+        self._health_level = 0
         self.health_icon.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self.health_icon.move(12, 1)
         contentlayout.addWidget(self.health_strip, 0)
 
-        contentlayout.addWidget(self.maintabs, 1)
-        contentlayout.addWidget(self.pagestack, 1)
+        # Main tabs and side pages are mutually exclusive: page 0 / page 1
+        self.rootstack = QStackedWidget()
+        self.rootstack.addWidget(self.maintabs)
+        self.rootstack.addWidget(self.pagestack)
+        contentlayout.addWidget(self.rootstack, 1)
 
         # Mission stage bar at the bottom of the content column
         self.mission_stage_bar = MissionStageBar()
         contentlayout.addWidget(self.mission_stage_bar, 0)
 
-        self.pagestack.hide()
-        self.maintabs.show()
+        self.rootstack.setCurrentIndex(0)
 
         # Outer shell: left telemetry rail + content column
         outer = QHBoxLayout()
@@ -201,12 +291,15 @@ class MainDashboardWindow(QMainWindow):
         container = QWidget()
         container.setLayout(outer)
         self.setCentralWidget(container)
+        self.setStyleSheet(LIGHT_QSS)
 
-        self.cockpitwindow = CockpitFloatingWindow(self)
-        self.cockpitwindow.hide()
+        # Floating cockpit is built on first CORE click
+        self.cockpitwindow = None
 
         self.missiontimer = QTimer()
-        self.missiontime = QTime(0, 0, 0)
+        # mm:ss display; coarse timing avoids raising the OS timer resolution
+        self.missiontimer.setTimerType(Qt.CoarseTimer)
+        self._mission_secs = 0
         self.missiontimer.timeout.connect(self.update_mission_time)
         self.missiontimer.start(1000)
 
@@ -214,18 +307,74 @@ class MainDashboardWindow(QMainWindow):
         self.telemetrypanel.tab_select.connect(self.show_stack_page)
 
         # Data flow wiring
-        self.csvtab.data_updated.connect(self.telemetrypanel.update_telemetry)
-        self.csvtab.data_updated.connect(self._forward_to_plot_and_cockpit)
+        self._csv_connected = False
+        self._set_csv_wiring(True)
         self.inputsourcechanged.connect(self.change_input_source)
 
         if self.logtab is not None:
             self.logtab.health_changed.connect(self._on_health_changed)
 
+        self._build_row_sinks()
+
+    # ---------------------------
+    # LAZY PAGES
+    # ---------------------------
+    def _make_control_tab(self):
+        from tabs.controltab import ControlTab
+        return ControlTab()
+
+    def _make_visual_tab(self):
+        from tabs.visualtab import VisualTab
+        return VisualTab()
+
+    def _make_dials_tab(self):
+        from tabs.systemdials import SystemDialsTab
+        return SystemDialsTab()
+
+    def _make_gps_tab(self):
+        try:
+            from tabs.gpstab import GPSTab
+            return GPSTab()
+        except Exception as e:
+            log.error("GPSTab init error: %s", e)
+            return QWidget()
+
+    def _materialize_page(self, index):
+        factory = self._stack_factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self.pagestack.widget(index)
+        self.pagestack.insertWidget(index, factory())
+        self.pagestack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def _materialize_tab(self, idx):
+        entry = self._tab_factories.pop(idx, None)
+        if entry is None:
+            return
+        title, factory = entry
+        placeholder = self.maintabs.widget(idx)
+        self.maintabs.insertTab(idx, factory(), title)
+        self.maintabs.removeTab(idx + 1)
+        placeholder.deleteLater()
+        self.maintabs.setCurrentIndex(idx)
+
     # Keep icon locked under timer across resizes
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._reposition_health_icon()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._show_mission_time()
+        self._reposition_health_icon()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Catch up on the clock text skipped while minimized
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._show_mission_time()
+
     def _reposition_health_icon(self):
         try:
             if not (self.health_strip and self.timerlabel and self.topbar):
@@ -235,7 +384,9 @@ class MainDashboardWindow(QMainWindow):
             lcenter = self.health_strip.mapFromGlobal(gcenter)
             x = max(8, int(lcenter.x() - self.health_icon.width() // 2))
             y = max(1, int(self.health_strip.height() // 2 - self.health_icon.height() // 2))
-            self.health_icon.move(x, y)
+            if (x, y) != self._last_icon_pos:
+                self._last_icon_pos = (x, y)
+                self.health_icon.move(x, y)
         except Exception:
             pass
 
@@ -243,19 +394,74 @@ class MainDashboardWindow(QMainWindow):
     # DATA FLOW HANDLERS
     # ---------------------------
     def _forward_to_plot_and_cockpit(self, row):
-        try:
-            if hasattr(self.plottab, "update_plot_data"):
-                self.plottab.update_plot_data(row)
-            if hasattr(self.cockpit_widget, "update_telemetry"):
-                self.cockpit_widget.update_telemetry(row)
-            if hasattr(self.cockpitwindow, "update_telemetry"):
-                self.cockpitwindow.update_telemetry(row)
-            if hasattr(self, 'mission_stage_bar'):
-                self.mission_stage_bar.set_telemetry_data(row)
-            if self.logtab is not None:
-                self.logtab.process_telemetry(row)
-        except Exception:
-            pass
+        self._pending_rows.append(row)
+        if not self._row_flush_timer.isActive():
+            self._row_flush_timer.start()
+
+    def _on_row_ready(self, row):
+        # data_updated is unplugged while XBee is live, so the table append
+        # (a no-op outside live mode) doesn't echo the row back to us
+        self.csvtab.append_live_data(row)
+        self.telemetrypanel.update_telemetry(row)
+        self._forward_to_plot_and_cockpit(row)
+
+    def _set_csv_wiring(self, on):
+        """Connect or disconnect the CSV tab's data_updated feed."""
+        if on == self._csv_connected:
+            return
+        sig = self.csvtab.data_updated
+        if on:
+            sig.connect(self.telemetrypanel.update_telemetry)
+            sig.connect(self._forward_to_plot_and_cockpit)
+        else:
+            try:
+                sig.disconnect(self.telemetrypanel.update_telemetry)
+                sig.disconnect(self._forward_to_plot_and_cockpit)
+            except (RuntimeError, TypeError):
+                pass
+        self._csv_connected = on
+
+    def _flush_rows(self):
+        rows, self._pending_rows = self._pending_rows, []
+        if not rows:
+            return
+        # Rows can carry different keys; the latest value of each one wins
+        latest = {}
+        for row in rows:
+            latest.update(row)
+        # A failing receiver is logged and skipped; the others still get the data
+        for sink in self._batch_sinks:
+            try:
+                sink(rows)
+            except Exception:
+                log.exception("Telemetry sink %r failed", sink)
+        for sink in self._row_sinks:
+            for row in rows:
+                try:
+                    sink(row)
+                except Exception:
+                    log.exception("Telemetry sink %r failed", sink)
+        for sink in self._latest_sinks:
+            try:
+                sink(latest)
+            except Exception:
+                log.exception("Telemetry sink %r failed", sink)
+
+    def _build_row_sinks(self):
+        """Resolve the telemetry receivers once; call again if a receiver is replaced."""
+        # Plot history and log checks need every row; the plot takes them in one call
+        self._batch_sinks = tuple(filter(None, (
+            getattr(self.plottab, "update_plot_data_batch", None),
+        )))
+        self._row_sinks = tuple(filter(None, (
+            self.logtab.process_telemetry if self.logtab is not None else None,
+        )))
+        # Display-only widgets just show the latest row
+        self._latest_sinks = tuple(filter(None, (
+            getattr(self.cockpit_widget, "update_telemetry", None),
+            getattr(self.cockpitwindow, "update_telemetry", None),
+            getattr(self, "mission_stage_bar", None) and self.mission_stage_bar.set_telemetry_data,
+        )))
 
     def change_input_source(self, name, details):
         self._stop_preproc_if_running()
@@ -270,61 +476,64 @@ class MainDashboardWindow(QMainWindow):
                     self.preproc = XBeeTelemetryWorker(port, baud)
                     self.preproc.connected.connect(lambda p: self.telemetrypanel.set_connection_state(True, f"XBee:{p}"))
                     self.preproc.connection_lost.connect(lambda msg: self.telemetrypanel.set_connection_state(False, msg))
-                    self.preproc.rowReady.connect(self.telemetrypanel.update_telemetry)
-                    if hasattr(self.csvtab, "append_live_data"):
-                        self.preproc.rowReady.connect(self.csvtab.append_live_data)
-                    else:
-                        self.preproc.rowReady.connect(self.csvtab.appendRow)
-                    if hasattr(self.plottab, "update_plot_data"):
-                        self.preproc.rowReady.connect(self.plottab.update_plot_data)
-                    if hasattr(self.cockpit_widget, "update_telemetry"):
-                        self.preproc.rowReady.connect(self.cockpit_widget.update_telemetry)
-                    if hasattr(self.cockpitwindow, "update_telemetry"):
-                        self.preproc.rowReady.connect(self.cockpitwindow.update_telemetry)
-                    if hasattr(self, 'mission_stage_bar'):
-                        self.preproc.rowReady.connect(self.mission_stage_bar.set_telemetry_data)
-                    if self.logtab is not None:
-                        self.preproc.rowReady.connect(self.logtab.process_telemetry)
                     self.telemetrypanel.set_connection_state(True, f"XBee:{port}")
                     self.preproc.start()
+                    # Rows are queued by the reader thread and picked up here,
+                    # rather than posting one queued signal per row
+                    self._xbee_drain_timer.start()
                 except Exception as e:
                     self.telemetrypanel.set_connection_state(False, "XBee FAIL")
-                    print("⚠️ Preprocessor start error:", e)
+                    log.warning("Preprocessor start error: %s", e)
             else:
                 self.telemetrypanel.set_connection_state(False, "XBee:NO PORT")
         elif name == "csv":
             self.telemetrypanel.set_connection_state(False, "CSV MODE")
         else:
             self.telemetrypanel.set_connection_state(False, "NO INPUT")
+        # The CSV feed only stays plugged in while no XBee reader is draining
+        self._set_csv_wiring(not self._xbee_drain_timer.isActive())
+
+    def _drain_preproc(self):
+        if self.preproc is None:
+            return
+        for row in self.preproc.drain():
+            self._on_row_ready(row)
 
     def _stop_preproc_if_running(self):
+        self._xbee_drain_timer.stop()
         if getattr(self, "preproc", None):
             try:
                 self.preproc.stop()
             except Exception:
                 pass
             self.preproc = None
+        # Deliver what the old source already sent, then let the cockpits
+        # fall back to playback until the new source produces a row
+        self._flush_rows()
+        for cockpit in (self.cockpit_widget, self.cockpitwindow):
+            if cockpit is not None:
+                cockpit.set_live(False)
         self.telemetrypanel.set_connection_state(False, "DISCONNECTED")
 
     # ---------------------------
     # UI INTERACTIONS
     # ---------------------------
     def open_input_source_dialog(self):
-        print("Opening input source dialog")
-        dialog = InputSourceDialog(self)
-        dialog.input_source_selected.connect(self.handle_input_source_selected)
-        dialog.exec()
+        log.debug("Opening input source dialog")
+        # Built once and re-executed; the dialog refreshes itself on show
+        if self._input_dialog is None:
+            self._input_dialog = InputSourceDialog(self)
+            self._input_dialog.input_source_selected.connect(self.handle_input_source_selected)
+        self._input_dialog.exec()
 
     def handle_input_source_selected(self, sourceid, extra):
-        print(f"Input source selected: {sourceid}, details: {extra}")
+        log.debug("Input source selected: %s, details: %s", sourceid, extra)
         self.active_input_source = sourceid
         self.active_input_details = extra
-        if sourceid == "csv":
-            self.inputstatus.setText(f"Input Source: CSV File\n{extra}")
-        elif sourceid in ("xbee_serial", "xbee_wired"):
-            self.inputstatus.setText(f"Input Source: XBee ({extra})")
-        else:
-            self.inputstatus.setText("Input Source: [Unknown]")
+        text = self._STATUS_FMT.get(sourceid, "Input Source: [Unknown]").format(extra)
+        # Same source picked again: skip the relayout of the top bar
+        if text != self.inputstatus.text():
+            self.inputstatus.setText(text)
         self.inputsourcechanged.emit(sourceid, extra)
 
     def toggle_admin_tab_hidden(self, event):
@@ -335,47 +544,65 @@ class MainDashboardWindow(QMainWindow):
             self.maintabs.setCurrentIndex(idx)
 
     def toggle_cockpit_window(self):
+        if self.cockpitwindow is None:
+            self.cockpitwindow = CockpitFloatingWindow(self)
+            self._build_row_sinks()
         if self.cockpitwindow.isVisible():
             self.cockpitwindow.hide()
         else:
             self.cockpitwindow.show()
 
     def update_mission_time(self):
-        self.missiontime = self.missiontime.addSecs(1)
-        self.timerlabel.setText(f"Mission Time {self.missiontime.toString('mm:ss')}")
-        self._reposition_health_icon()  # keep aligned on tick too
+        # The clock keeps counting while hidden; only the label is left alone
+        self._mission_secs += 1
+        if self.isVisible() and not self.isMinimized():
+            self._show_mission_time()
+
+    def _show_mission_time(self):
+        if self.timerlabel is None:
+            return
+        m, s = divmod(self._mission_secs, 60)
+        text = f"Mission Time {m:02d}:{s:02d}"
+        if text != self.timerlabel.text():
+            self.timerlabel.setText(text)
 
     def show_stack_page(self, index):
-        self.maintabs.hide()
-        self.pagestack.show()
+        self._materialize_page(index)
         self.pagestack.setCurrentIndex(index)
+        self.rootstack.setCurrentIndex(1)
 
     def on_main_tab_changed(self, idx):
-        self.pagestack.hide()
-        self.maintabs.show()
+        self._materialize_tab(idx)
+        self.rootstack.setCurrentIndex(0)
 
     def show_home_tabs(self):
-        self.pagestack.hide()
-        self.maintabs.show()
+        self.rootstack.setCurrentIndex(0)
         self.maintabs.setCurrentIndex(0)
 
     def toggle_theme(self):
-        if self.themebtn.isChecked():
-            self.setStyleSheet("""
-                QMainWindow, QWidget { background: #232b2b; color: #e7eaf3; }
-                QTabWidget::pane { background: #292e38; }
-                QTabBar::tab { background: #444; color: #fafbfc; }
-                QTabBar::tab:selected { background: #298af8; }
-                QFrame { background: #22282b; }
-                QPushButton, QLineEdit, QLabel { background: #333942; border: 1px solid #444; color: #e3eaf3; }
-            """)
-        else:
-            self.setStyleSheet("")
+        want = self.themebtn.isChecked()
+        if want == self.themedark:
+            return
+        self.themedark = want
+        # Repolishing every descendant would otherwise repaint piecemeal
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(DARK_QSS if want else LIGHT_QSS)
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ---------------------------
     # HEALTH ICON COLOR
     # ---------------------------
     def _on_health_changed(self, level: int, reason: str):
-        color = "#2ecc71" if level == 0 else ("#f1c40f" if level == 1 else "#e74c3c")
-        self.health_icon.setStyleSheet(f"color:{color}; background:transparent; font-size:16px;")
-        self.health_icon.setToolTip(reason or "")
+        # Emitted for every telemetry row; restyle only when the level moves
+        level = min(max(level, 0), 2)
+        if level != self._health_level:
+            self._health_level = level
+            self.health_icon.setProperty("hl", self._HEALTH_LEVELS[level])
+            style = self.health_icon.style()
+            style.unpolish(self.health_icon)
+            style.polish(self.health_icon)
+        reason = reason or ""
+        if reason != self.health_icon.toolTip():
+            self.health_icon.setToolTip(reason)
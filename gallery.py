@@ -1,11 +1,27 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget, 
-    QFrame, QFileDialog, QDialog, QGraphicsDropShadowEffect, QCheckBox, QSlider
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QFrame, QFileDialog, QDialog, QCheckBox, QSlider
 )
-from PySide6.QtGui import QPixmap, QFont, QColor
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QImageIOHandler, QFont, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
+from functools import lru_cache
 import os
 
+# Shared by every card instead of a fresh QFont per label
+FONT_DIALOG_TITLE = QFont("Segoe UI", 20, QFont.Weight.Bold)
+FONT_TITLE = QFont("Segoe UI", 14, QFont.Weight.Bold)
+FONT_CAPTION = QFont("Segoe UI", 10)
+FONT_TS = QFont("Segoe UI", 9, QFont.Weight.Medium)
+
+# One sheet on the card frame; its labels are picked out by object name
+CARD_QSS = """
+    QFrame { background: #eef3fa; border-radius: 14px; padding:10px; }
+    QLabel#cardTitle { color: #1889f0; }
+    QLabel#cardCaption { color:#333; background: #f9f9fb; border-radius:7px; padding:6px 12px; }
+    QLabel#cardTs { color: #666; }
+    QPushButton#cardFav { background:none; border:none; font-size:18px; color:#f1c40f; }
+"""
+
 class MissionEvent:
     def __init__(self, image_path, title, caption, timestamp):
         self.image_path = image_path
@@ -14,14 +30,98 @@ class MissionEvent:
         self.timestamp = timestamp
         self.favorite = False
 
-def safe_pixmap(path, w=640, h=360):
-    if path.lower().endswith(".pdf"):
-        return None
-    if os.path.exists(path):
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            return pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-    return None
+def _pixmap_key(path, w, h, mtime, smooth=True):
+    # mtime is part of the key so an edited file is decoded again
+    key = f"{path}|{w}x{h}|{mtime}"
+    return key if smooth else key + "|fast"
+
+def _read_scaled(path, w, h, smooth=True):
+    """Decode path straight to its w x h fit; JPEGs are scaled inside the decoder.
+
+    smooth=False is for thumbnails: a fast DCT where the decoder scales,
+    nearest-neighbour scaling everywhere else.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if not size.isValid():
+        return reader.read()
+    # size is pre-rotation and so is the scaled size, so fit a quarter-turned
+    # image into the swapped box
+    rotated = bool(reader.transformation() & QImageIOHandler.TransformationRotate90)
+    if rotated:
+        size.scale(h, w, Qt.KeepAspectRatio)
+    else:
+        size.scale(w, h, Qt.KeepAspectRatio)
+    if smooth or reader.supportsOption(QImageIOHandler.ScaledSize):
+        if not smooth:
+            reader.setQuality(25)
+        reader.setScaledSize(size)
+        return reader.read()
+    # QImageReader's own fallback scaling is always smooth; do it by hand
+    img = reader.read()
+    if img.isNull():
+        return img
+    if rotated:
+        size.transpose()
+    return img.scaled(size, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+
+@lru_cache(maxsize=None)
+def _asset_index(dirpath):
+    """Names of the files in dirpath, listed once with a single scandir pass."""
+    try:
+        with os.scandir(dirpath or ".") as it:
+            return frozenset(e.name for e in it if e.is_file())
+    except OSError:
+        return frozenset()
+
+def _asset_exists(path):
+    dirpath, name = os.path.split(path)
+    return name in _asset_index(dirpath)
+
+class _ImageLoaderSignals(QObject):
+    loaded = Signal(str, QImage)
+
+class ImageLoader(QRunnable):
+    """Decodes and scales one image on the thread pool; emits (key, QImage)."""
+    def __init__(self, key, path, w, h, smooth=True):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.w = w
+        self.h = h
+        self.smooth = smooth
+        self.signals = _ImageLoaderSignals()
+
+    def run(self):
+        img = _read_scaled(self.path, self.w, self.h, self.smooth)
+        self.signals.loaded.emit(self.key, img)
+
+def request_image(path, w, h, slot, smooth=True):
+    """Fetch path at w x h from QPixmapCache, or queue an async decode of it.
+
+    Returns (key, pixmap). On a cache hit pixmap is ready to use; otherwise
+    it is None and slot(key, image) runs on the GUI thread later. The key
+    lets the receiver ignore answers to stale requests.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0
+    key = _pixmap_key(path, w, h, mtime, smooth)
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return key, pixmap
+    loader = ImageLoader(key, path, w, h, smooth)
+    loader.signals.loaded.connect(slot)
+    QThreadPool.globalInstance().start(loader)
+    return key, None
+
+def image_to_pixmap(key, img):
+    """GUI-thread half of request_image: convert and remember the result."""
+    pixmap = QPixmap.fromImage(img)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 class FullscreenDialog(QDialog):
     def __init__(self, parent, img_path, title="", caption="", timestamp="", is_pdf=False):
@@ -34,7 +134,7 @@ class FullscreenDialog(QDialog):
         lay.setContentsMargins(40, 30, 40, 30)
 
         title_lbl = QLabel(title)
-        title_lbl.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+        title_lbl.setFont(FONT_DIALOG_TITLE)
         title_lbl.setStyleSheet("color:#38aaf7;")
         lay.addWidget(title_lbl, alignment=Qt.AlignHCenter)
 
@@ -45,17 +145,13 @@ class FullscreenDialog(QDialog):
             img_label.setStyleSheet("color: #ccc; font-size:16px; background:#1a202a; padding:30px; border-radius:14px;")
             img_label.setMinimumSize(500, 280)
         else:
-            pixmap = safe_pixmap(img_path, 1200, 800)
-            if pixmap:
-                img_label.setPixmap(pixmap)
+            img_label.setMinimumSize(500, 280)
+            self._image_key, pixmap = request_image(img_path, 1200, 800, self._on_image_loaded)
+            if pixmap is None:
+                img_label.setText("Loading…")
             else:
-                img_label.setText("[No Image]")
-                img_label.setMinimumSize(500, 280)
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(40)
-        shadow.setColor(QColor("#106088"))
-        shadow.setYOffset(6)
-        img_label.setGraphicsEffect(shadow)
+                img_label.setPixmap(pixmap)
+        self.img_label = img_label
         lay.addWidget(img_label, alignment=Qt.AlignHCenter)
 
         cap = QLabel(caption)
@@ -76,52 +172,87 @@ class FullscreenDialog(QDialog):
         close_btn.clicked.connect(self.accept)
         lay.addWidget(close_btn, alignment=Qt.AlignHCenter)
 
+    def _on_image_loaded(self, key, img):
+        if key != self._image_key:
+            return
+        if img.isNull():
+            self.img_label.setText("[No Image]")
+        else:
+            self.img_label.setPixmap(image_to_pixmap(key, img))
+
 class MissionCarouselCard(QFrame):
+    """One card reused for every slide; set_event swaps what it shows."""
     def __init__(self, event, show_full_fn, toggle_fav_fn):
         super().__init__()
+        self._mission_event = None
+        self._image_key = None
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
 
-        title = QLabel(event.title)
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        title.setStyleSheet("color: #1889f0;")
-        layout.addWidget(title, alignment=Qt.AlignHCenter)
+        self.title = QLabel()
+        self.title.setObjectName("cardTitle")
+        self.title.setFont(FONT_TITLE)
+        layout.addWidget(self.title, alignment=Qt.AlignHCenter)
 
         self.img_label = QLabel()
-        pixmap = safe_pixmap(event.image_path, 340, 200)
-        if pixmap:
-            self.img_label.setPixmap(pixmap)
-        else:
-            self.img_label.setText("[No Image]")
-            self.img_label.setAlignment(Qt.AlignCenter)
+        self.img_label.setAlignment(Qt.AlignCenter)
         self.img_label.setFixedSize(340, 200)
         self.img_label.setCursor(Qt.PointingHandCursor)
         self.img_label.mousePressEvent = lambda ev: show_full_fn(
-            event.image_path, event.title, event.caption, event.timestamp, event.image_path.lower().endswith(".pdf")
+            self._mission_event.image_path, self._mission_event.title, self._mission_event.caption, self._mission_event.timestamp,
+            self._mission_event.image_path.lower().endswith(".pdf")
         )
         layout.addWidget(self.img_label, alignment=Qt.AlignHCenter)
 
-        caption = QLabel(event.caption)
-        caption.setFont(QFont("Segoe UI", 10))
-        caption.setStyleSheet("color:#333; background: #f9f9fb; border-radius:7px; padding:6px 12px;")
-        caption.setWordWrap(True)
-        layout.addWidget(caption, alignment=Qt.AlignHCenter)
+        self.caption = QLabel()
+        self.caption.setObjectName("cardCaption")
+        self.caption.setFont(FONT_CAPTION)
+        self.caption.setWordWrap(True)
+        layout.addWidget(self.caption, alignment=Qt.AlignHCenter)
 
         ts_fav = QHBoxLayout()
-        ts = QLabel(event.timestamp)
-        ts.setFont(QFont("Segoe UI", 9, QFont.Weight.Medium))
-        ts.setStyleSheet("color: #666;")
-        ts_fav.addWidget(ts, alignment=Qt.AlignLeft)
+        self.ts = QLabel()
+        self.ts.setObjectName("cardTs")
+        self.ts.setFont(FONT_TS)
+        ts_fav.addWidget(self.ts, alignment=Qt.AlignLeft)
 
-        fav_btn = QPushButton("⭐" if event.favorite else "☆")
-        fav_btn.setFixedSize(40, 28)
-        fav_btn.setStyleSheet("background:none; border:none; font-size:18px; color:#f1c40f;")
-        fav_btn.clicked.connect(lambda: toggle_fav_fn(event, fav_btn))
-        ts_fav.addWidget(fav_btn, alignment=Qt.AlignRight)
+        self.fav_btn = QPushButton()
+        self.fav_btn.setObjectName("cardFav")
+        self.fav_btn.setFixedSize(40, 28)
+        self.fav_btn.clicked.connect(lambda: toggle_fav_fn(self._mission_event, self.fav_btn))
+        ts_fav.addWidget(self.fav_btn, alignment=Qt.AlignRight)
 
         layout.addLayout(ts_fav)
 
-        self.setStyleSheet("QFrame { background: #eef3fa; border-radius: 14px; padding:10px; }")
+        self.setStyleSheet(CARD_QSS)
+        self.set_event(event)
+
+    def set_event(self, event):
+        self._mission_event = event
+        self.title.setText(event.title)
+        self.caption.setText(event.caption)
+        self.ts.setText(event.timestamp)
+        self.fav_btn.setText("⭐" if event.favorite else "☆")
+        # Bundled slides whose asset isn't shipped skip the loader entirely
+        if event.image_path.lower().endswith(".pdf") or not _asset_exists(event.image_path):
+            self._image_key = None
+            self.img_label.setText("[No Image]")
+            return
+        # Decoded off the GUI thread; placeholder text until it lands
+        self._image_key, pixmap = request_image(
+            event.image_path, 340, 200, self._on_image_loaded, smooth=False)
+        if pixmap is None:
+            self.img_label.setText("Loading…")
+        else:
+            self.img_label.setPixmap(pixmap)
+
+    def _on_image_loaded(self, key, img):
+        if key != self._image_key:
+            return
+        if img.isNull():
+            self.img_label.setText("[No Image]")
+        else:
+            self.img_label.setPixmap(image_to_pixmap(key, img))
 
 class GalleryTab(QWidget):
     def __init__(self, parent=None):
@@ -134,6 +265,8 @@ class GalleryTab(QWidget):
         ]
         self.carousel_index = 0
         self.slideshow_timer = QTimer(self)
+        self.slideshow_timer.setInterval(3000)  # 3 sec
+        self.slideshow_timer.timeout.connect(self._advance_slideshow)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(25, 20, 25, 25)
@@ -153,14 +286,9 @@ class GalleryTab(QWidget):
 
         main_layout.addLayout(action_bar)
 
-        # Carousel
-        self.carousel = QStackedWidget()
-        self.card_widgets = []
-        for event in self.events:
-            card = MissionCarouselCard(event, self.show_fullscreen, self.toggle_favorite)
-            self.carousel.addWidget(card)
-            self.card_widgets.append(card)
-        main_layout.addWidget(self.carousel, 8)
+        # Carousel: a single card, refilled on navigation
+        self.card = MissionCarouselCard(self.events[0], self.show_fullscreen, self.toggle_favorite)
+        main_layout.addWidget(self.card, 8)
 
         # Navigation
         nav_layout = QHBoxLayout()
@@ -179,8 +307,16 @@ class GalleryTab(QWidget):
 
         self.prev_btn = prev_btn
         self.next_btn = next_btn
+        self._prev_enabled = None
+        self._next_enabled = None
         self._update_nav_buttons()
 
+        # Arrow keys page the carousel while the tab has focus
+        for key, slot in ((Qt.Key_Left, self.prev_slide), (Qt.Key_Right, self.next_slide)):
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(slot)
+
     def show_fullscreen(self, img_path, title, caption, ts, is_pdf):
         dlg = FullscreenDialog(self, img_path, title, caption, ts, is_pdf)
         dlg.exec()
@@ -197,32 +333,47 @@ class GalleryTab(QWidget):
 
     def prev_slide(self):
         if self.carousel_index > 0:
-            self.carousel_index -= 1
-            self.carousel.setCurrentIndex(self.carousel_index)
-            self.counter_label.setText(self._counter_text())
-            self._update_nav_buttons()
+            self._show_slide(self.carousel_index - 1)
 
     def next_slide(self):
         if self.carousel_index < len(self.events) - 1:
-            self.carousel_index += 1
-            self.carousel.setCurrentIndex(self.carousel_index)
-            self.counter_label.setText(self._counter_text())
-            self._update_nav_buttons()
+            self._show_slide(self.carousel_index + 1)
+
+    def _show_slide(self, index):
+        if index == self.carousel_index:
+            return
+        self.carousel_index = index
+        self.card.set_event(self.events[index])
+        self.counter_label.setText(self._counter_text())
+        self._update_nav_buttons()
 
     def _counter_text(self):
         return f"{self.carousel_index+1} / {len(self.events)}"
 
     def _update_nav_buttons(self):
-        self.prev_btn.setEnabled(self.carousel_index != 0)
-        self.next_btn.setEnabled(self.carousel_index != len(self.events) - 1)
+        # setEnabled restyles even when the state is unchanged, so compare first
+        prev_on = self.carousel_index != 0
+        next_on = self.carousel_index != len(self.events) - 1
+        if prev_on != self._prev_enabled:
+            self._prev_enabled = prev_on
+            self.prev_btn.setEnabled(prev_on)
+        if next_on != self._next_enabled:
+            self._next_enabled = next_on
+            self.next_btn.setEnabled(next_on)
 
     def toggle_slideshow(self, state):
-        if state == Qt.Checked:
-            self.slideshow_timer.timeout.connect(self.next_slide)
-            self.slideshow_timer.start(3000)  # 3 sec
+        if self.auto_slide_chk.isChecked():
+            self.slideshow_timer.start()
         else:
             self.slideshow_timer.stop()
 
+    def _advance_slideshow(self):
+        # Loop back to the first slide instead of idling on the last one
+        if self.carousel_index < len(self.events) - 1:
+            self.next_slide()
+        else:
+            self._show_slide(0)
+
     def toggle_favorite(self, event, btn):
         event.favorite = not event.favorite
         btn.setText("⭐" if event.favorite else "☆")
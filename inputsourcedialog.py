@@ -4,20 +4,78 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QRadioButton, QPushButton, QHBoxLayout,
     QMessageBox, QFileDialog, QListWidget
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QObject, QRunnable, QThreadPool, QSocketNotifier
+import os
 import sys
-import glob
-import serial
+import time
+import ctypes
+
+try:
+    from serial.tools import list_ports
+except ImportError:
+    list_ports = None
+
+# Optional on Linux: udev hotplug events keep the port list current without rescans
+try:
+    import pyudev
+except Exception:
+    pyudev = None
+
+# Candidate device names for the fallback probe; the platform can't change at runtime.
+# _PORT_MATCH picks serial nodes out of /dev by name.
+if sys.platform.startswith('win'):
+    _PORT_CANDIDATES = tuple(f'COM{i+1}' for i in range(256))
+    _PORT_MATCH = None
+elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
+    _PORT_CANDIDATES = ()
+    _PORT_MATCH = lambda name: name.startswith('tty') and name[3:4].isalpha()
+elif sys.platform.startswith('darwin'):
+    _PORT_CANDIDATES = ()
+    _PORT_MATCH = lambda name: name.startswith('tty.')
+else:
+    _PORT_CANDIDATES = ()
+    _PORT_MATCH = None
+
+
+def _dos_device_exists(name):
+    """True if Windows has a DOS device called name (e.g. COM3); nothing is opened."""
+    buf = ctypes.create_unicode_buffer(512)
+    return ctypes.windll.kernel32.QueryDosDeviceW(name, buf, len(buf)) != 0
+
+
+class _PortScanSignals(QObject):
+    ports_ready = Signal(list)
+
+
+class PortScanner(QRunnable):
+    """Runs a port listing function on the thread pool; emits the list."""
+    def __init__(self, scan):
+        super().__init__()
+        self.scan = scan
+        self.signals = _PortScanSignals()
+
+    def run(self):
+        try:
+            ports = self.scan()
+        except Exception:
+            ports = []
+        self.signals.ports_ready.emit(ports)
 
 
 class InputSourceDialog(QDialog):
     input_source_selected = Signal(str, object)  # (source_id, extra_details)
 
+    # Last port scan, shared by every dialog instance: (monotonic time, ports)
+    _PORT_CACHE_TTL = 2.0
+    _port_cache = (float("-inf"), [])
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Select Input Source")
         self.setMinimumWidth(420)
 
+        self._scanning = False
+
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel(
             "<b>Select telemetry input source:</b><br>"
@@ -40,6 +98,9 @@ class InputSourceDialog(QDialog):
 
         # Buttons
         btn_layout = QHBoxLayout()
+        self.btn_refresh = QPushButton("Refresh")
+        self.btn_refresh.setVisible(False)
+        btn_layout.addWidget(self.btn_refresh)
         btn_ok = QPushButton("OK")
         btn_cancel = QPushButton("Cancel")
         btn_layout.addWidget(btn_ok)
@@ -48,42 +109,125 @@ class InputSourceDialog(QDialog):
 
         # Connections
         self.radio_xbee_serial.toggled.connect(self.update_com_ports)
+        self.btn_refresh.clicked.connect(self.refresh_com_ports)
         btn_ok.clicked.connect(self.accept_dialog)
         btn_cancel.clicked.connect(self.reject)
 
+        self._udev_monitor = None
+        self._hotplug = None
+        self._start_hotplug_monitor()
+
+    def showEvent(self, event):
+        """The dialog is reused between clicks; refresh ports that may have changed."""
+        super().showEvent(event)
+        if self.radio_xbee_serial.isChecked():
+            self.update_com_ports()
+
     # ---------------------
     #   Port Listing Logic
     # ---------------------
     def update_com_ports(self):
         """Show available COM ports when serial option selected."""
         self.com_ports_list.setVisible(self.radio_xbee_serial.isChecked())
+        self.btn_refresh.setVisible(self.radio_xbee_serial.isChecked())
+        if not self.radio_xbee_serial.isChecked():
+            return
+        ts, ports = self._port_cache
+        if time.monotonic() - ts < self._PORT_CACHE_TTL:
+            self._show_ports(ports)
+            return
+        if self._scanning:
+            return
+        # Scan on the thread pool so the dialog (and the window behind it) keep painting
+        self._scanning = True
+        self.com_ports_list.clear()
+        self.com_ports_list.addItem("Scanning…")
+        scanner = PortScanner(self.list_serial_ports)
+        scanner.signals.ports_ready.connect(self._on_ports_ready, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(scanner)
+
+    def _on_ports_ready(self, ports):
+        # Delivered to this dialog only while it exists; Qt drops it otherwise
+        self._scanning = False
+        type(self)._port_cache = (time.monotonic(), ports)
         if self.radio_xbee_serial.isChecked():
-            ports = self.list_serial_ports()
-            self.com_ports_list.clear()
-            if ports:
-                self.com_ports_list.addItems(ports)
-            else:
-                self.com_ports_list.addItem("No COM ports detected")
-
-    def list_serial_ports(self):
-        """Cross-platform COM port listing."""
-        if sys.platform.startswith('win'):
-            ports = [f'COM{i+1}' for i in range(256)]
-        elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-            ports = glob.glob('/dev/tty[A-Za-z]*')
-        elif sys.platform.startswith('darwin'):
-            ports = glob.glob('/dev/tty.*')
+            self._show_ports(ports)
+
+    def _show_ports(self, ports):
+        self.com_ports_list.clear()
+        if ports:
+            self.com_ports_list.addItems(ports)
         else:
-            return []
-        result = []
-        for port in ports:
+            self.com_ports_list.addItem("No COM ports detected")
+
+    def _start_hotplug_monitor(self):
+        """Linux with pyudev: follow tty add/remove events instead of polling."""
+        if pyudev is None or not sys.platform.startswith('linux'):
+            return
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            monitor.start()
+        except Exception:
+            return
+        self._udev_monitor = monitor
+        self._hotplug = QSocketNotifier(monitor.fileno(), QSocketNotifier.Read, self)
+        self._hotplug.activated.connect(self._on_hotplug)
+
+    def _on_hotplug(self, *_):
+        events = []
+        while True:
+            device = self._udev_monitor.poll(0)
+            if device is None:
+                break
+            node = device.device_node
+            # Virtual consoles and ptys aren't serial ports
+            if not node or '/virtual/' in device.sys_path:
+                continue
+            events.append((device.action, node))
+        if not events:
+            return
+        ts, cached = self._port_cache
+        if time.monotonic() - ts >= self._PORT_CACHE_TTL:
+            # No fresh scan to patch; drop it so the list is read again
+            type(self)._port_cache = (float("-inf"), [])
+            self.update_com_ports()
+            return
+        ports = list(cached)
+        for action, node in events:
+            if action == 'add' and node not in ports:
+                ports.append(node)
+            elif action == 'remove' and node in ports:
+                ports.remove(node)
+        # Keep the scan's timestamp so patched lists still expire on schedule
+        type(self)._port_cache = (ts, ports)
+        if self.radio_xbee_serial.isChecked() and not self._scanning:
+            self._show_ports(ports)
+
+    def refresh_com_ports(self):
+        """Drop the cached scan and list the ports again."""
+        type(self)._port_cache = (float("-inf"), [])
+        self.update_com_ports()
+
+    @staticmethod
+    def list_serial_ports():
+        """Cross-platform COM port listing. Touches no widgets, so it can run off the GUI thread."""
+        if list_ports is not None:
+            # Read from the OS device registry; no port is opened
+            return [p.device for p in list_ports.comports()]
+        return InputSourceDialog._probe_serial_ports()
+
+    @staticmethod
+    def _probe_serial_ports():
+        """Fallback for pyserial builds without serial.tools; checks existence without opening."""
+        if _PORT_MATCH:
+            # One scandir pass over /dev; every entry listed exists
             try:
-                s = serial.Serial(port)
-                s.close()
-                result.append(port)
-            except Exception:
-                pass
-        return result
+                with os.scandir('/dev') as it:
+                    return [e.path for e in it if _PORT_MATCH(e.name)]
+            except OSError:
+                return []
+        return [p for p in _PORT_CANDIDATES if _dos_device_exists(p)]
 
     # ---------------------
     #   Selection Logic
@@ -106,6 +250,9 @@ class InputSourceDialog(QDialog):
             self.accept()
 
         elif self.radio_xbee_serial.isChecked():
+            if self._scanning:
+                QMessageBox.information(self, "Scanning", "Still looking for serial ports, please wait.")
+                return
             if not self.com_ports_list.currentItem():
                 QMessageBox.warning(self, "No Port", "Please select a COM port from the list.")
                 return
@@ -1,15 +1,21 @@
 # main.py
 import sys, os
-os.environ["QTOPENGL"] = "software"
-os.environ["QT_QUICK_BACKEND"] = "software"
+import logging
+# Software rendering is opt-in for machines with broken GL drivers
+if os.environ.get("RUDRA_FORCE_SOFTWARE_GL"):
+    os.environ.setdefault("QT_OPENGL", "software")
+    os.environ.setdefault("QT_QUICK_BACKEND", "software")
 
 from PySide6.QtWidgets import QApplication
-from qt_material import apply_stylesheet
-from control import LoginWindow
+from PySide6.QtGui import QPixmapCache
 
 class MainApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
+        # Room for the gallery's full-size dialog images next to its thumbnails
+        QPixmapCache.setCacheLimit(64 * 1024)
+        # Imported here so the theme's XML parsing doesn't run before the app exists
+        from qt_material import apply_stylesheet
         apply_stylesheet(self.app, theme='light_blue.xml')
 
     def run(self):
@@ -17,6 +23,7 @@ class MainApp:
 
     def show_login(self):
         try:
+            from control import LoginWindow
             self.window = LoginWindow()
             self.window.show()
             self.window.login_successful.connect(self.show_dashboard)
@@ -38,4 +45,6 @@ class MainApp:
             print(traceback.format_exc())
 
 if __name__ == "__main__":
+    # Debug chatter from the UI modules stays off unless asked for
+    logging.basicConfig(level=logging.WARNING)
     MainApp().run()
@@ -1,7 +1,43 @@
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, Property, QPointF, QRectF, QPoint
-from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor, QLinearGradient, QRadialGradient, QFont, QPolygon, QBrush
+from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, Property, QPointF, QRectF, QPoint, QLineF, QElapsedTimer
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor, QLinearGradient, QRadialGradient, QFont, QPolygon, QBrush, QPixmap, QFontMetrics
 import math
+from array import array
+
+# Paint resources shared by every frame; only the fonts are made per widget
+_DIAL_BG = QRadialGradient(40, 40, 40)
+_DIAL_BG.setColorAt(0, QColor(30, 35, 50, 200))
+_DIAL_BG.setColorAt(1, QColor(15, 20, 35, 230))
+_DIAL_RIM_PEN = QPen(QColor(80, 120, 180, 180), 2)
+_TICK_COLOR = QColor(200, 220, 255)
+_LABEL_COLOR = QColor(180, 200, 240)
+_NEEDLE_BRUSH = QBrush(QColor(255, 80, 80, 200))
+_NEEDLE = QPolygon([QPoint(-3, 0), QPoint(0, -25), QPoint(3, 0), QPoint(0, 5)])
+_ARC_BG_PEN = QPen(QColor(60, 70, 90, 150), 6)
+_ARC_PEN = QPen(QColor(100, 200, 255, 220), 6)
+_ARC_RECT = QRectF(-28, -28, 56, 56)
+
+# Compass ticks and their labels every 45 degrees, in the dial's centred coordinates
+_COMPASS_POINTS = {0: "N", 45: "NE", 90: "E", 135: "SE", 180: "S",
+                   225: "SW", 270: "W", 315: "NW"}
+_COMPASS_TICKS = [
+    QLineF(28 * math.sin(math.radians(i)), -28 * math.cos(math.radians(i)),
+           32 * math.sin(math.radians(i)), -32 * math.cos(math.radians(i)))
+    for i in range(0, 360, 45)
+]
+_COMPASS_LABELS = [
+    (int(24 * math.cos(math.radians(i - 90)) - 8), int(24 * math.sin(math.radians(i - 90)) + 4),
+     _COMPASS_POINTS.get(i, ""))
+    for i in range(0, 360, 45)
+]
+
+_PATH_PEN = QPen(QColor(80, 100, 140, 120), 4)
+_PROGRESS_PEN = QPen(QColor(100, 200, 255, 250), 5)
+_MARKER_ACTIVE_BRUSH = QBrush(QColor(100, 200, 255, 220))
+_MARKER_ACTIVE_PEN = QPen(QColor(150, 220, 255), 2)
+_MARKER_INACTIVE_BRUSH = QBrush(QColor(60, 80, 110, 180))
+_MARKER_INACTIVE_PEN = QPen(QColor(80, 100, 140), 2)
+_STAGE_COLORS = (QColor(120, 140, 180), QColor(200, 220, 255))  # inactive, active
 
 class CompassWidget(QWidget):
     """Left-side compass indicator"""
@@ -9,53 +45,45 @@ class CompassWidget(QWidget):
         super().__init__(parent)
         self._angle = 0.0
         self.setFixedSize(80, 80)
-        self._pointText = {0: "N", 45: "NE", 90: "E", 135: "SE", 180: "S",
-                          225: "SW", 270: "W", 315: "NW"}
+        self._pointText = _COMPASS_POINTS
+        self._font_ticks = QFont("Segoe UI", 8, QFont.Weight.Bold)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Background circle
-        gradient = QRadialGradient(40, 40, 40)
-        gradient.setColorAt(0, QColor(30, 35, 50, 200))
-        gradient.setColorAt(1, QColor(15, 20, 35, 230))
-        painter.setBrush(gradient)
-        painter.setPen(QPen(QColor(80, 120, 180, 180), 2))
+        painter.setBrush(_DIAL_BG)
+        painter.setPen(_DIAL_RIM_PEN)
         painter.drawEllipse(5, 5, 70, 70)
         
         # Draw compass markings
         painter.save()
         painter.translate(40, 40)
         
-        font = QFont("Segoe UI", 8, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setFont(self._font_ticks)
         
-        for i in range(0, 360, 45):
-            painter.save()
-            painter.rotate(i)
-            painter.setPen(QColor(200, 220, 255))
-            painter.drawLine(0, -28, 0, -32)
-            painter.restore()
-            
-            # Draw text
-            angle_rad = math.radians(i - 90)
-            x = 24 * math.cos(angle_rad)
-            y = 24 * math.sin(angle_rad)
-            text = self._pointText.get(i, "")
-            painter.setPen(QColor(180, 200, 240))
-            painter.drawText(int(x - 8), int(y + 4), text)
+        painter.setPen(_TICK_COLOR)
+        painter.drawLines(_COMPASS_TICKS)
+        
+        # Draw text
+        painter.setPen(_LABEL_COLOR)
+        for x, y, text in _COMPASS_LABELS:
+            painter.drawText(x, y, text)
         
         # Draw needle - FIXED: Use QPoint instead of QPointF for QPolygon
         painter.rotate(self._angle)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(255, 80, 80, 200))
-        needle = QPolygon([QPoint(-3, 0), QPoint(0, -25), QPoint(3, 0), QPoint(0, 5)])
-        painter.drawPolygon(needle)
+        painter.setBrush(_NEEDLE_BRUSH)
+        painter.drawPolygon(_NEEDLE)
         
         painter.restore()
     
     def setAngle(self, angle):
+        # Whole degrees only; noisy sub-degree heading changes don't repaint
+        if not math.isfinite(angle):
+            return
+        angle = float(round(angle) % 360)
         if angle != self._angle:
             self._angle = angle
             self.update()
@@ -70,17 +98,15 @@ class AccelerationGauge(QWidget):
         self._value = 0.0
         self._max_value = 3000.0  # km/h or m/s
         self.setFixedSize(80, 80)
+        self._font_value = QFont("Segoe UI", 10, QFont.Weight.Bold)
     
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Background
-        gradient = QRadialGradient(40, 40, 40)
-        gradient.setColorAt(0, QColor(30, 35, 50, 200))
-        gradient.setColorAt(1, QColor(15, 20, 35, 230))
-        painter.setBrush(gradient)
-        painter.setPen(QPen(QColor(80, 120, 180, 180), 2))
+        painter.setBrush(_DIAL_BG)
+        painter.setPen(_DIAL_RIM_PEN)
         painter.drawEllipse(5, 5, 70, 70)
         
         # Draw arc gauge
@@ -88,45 +114,59 @@ class AccelerationGauge(QWidget):
         painter.translate(40, 40)
         
         # Arc path
-        rect = QRectF(-28, -28, 56, 56)
+        rect = _ARC_RECT
         start_angle = 225 * 16  # Qt uses 1/16th degree
         span_angle = -270 * 16
         
         # Background arc
-        painter.setPen(QPen(QColor(60, 70, 90, 150), 6))
+        painter.setPen(_ARC_BG_PEN)
         painter.drawArc(rect, start_angle, span_angle)
         
         # Progress arc
         progress = min(self._value / self._max_value, 1.0)
         progress_span = int(span_angle * progress)
-        painter.setPen(QPen(QColor(100, 200, 255, 220), 6))
+        painter.setPen(_ARC_PEN)
         painter.drawArc(rect, start_angle, progress_span)
         
         # Center value text
-        painter.setPen(QColor(200, 220, 255))
-        font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setPen(_TICK_COLOR)
+        painter.setFont(self._font_value)
         text = f"{int(self._value)}"
         painter.drawText(-20, 5, text)
         
         painter.restore()
     
     def setValue(self, value):
-        if value != self._value:
-            self._value = min(value, self._max_value)
+        if not math.isfinite(value):
+            return
+        value = min(value, self._max_value)
+        # Repaint only when the whole-number readout changes
+        if int(value) != int(self._value):
+            self._value = value
             self.update()
     
     value = Property(float, lambda self: self._value, setValue)
 
 
 class MissionStageBar(QWidget):
-    """SpaceX-style mission stage progress bar with curved path"""
-    def __init__(self, parent=None):
+    """SpaceX-style mission stage progress bar with curved path
+
+    demo=True animates made-up telemetry on a 50 ms timer; off by default so
+    the bar only repaints when real data arrives.
+    """
+    def __init__(self, parent=None, demo=False):
         super().__init__(parent)
         self.setFixedHeight(120)
         self._progress = 0.0  # 0.0 to 1.0
         self.current_stage = 0
         self.stages = ["LIFTOFF", "MAX Q", "STAGE SEP", "LANDING"]
+        self._font_inactive = QFont("Segoe UI", 9, QFont.Weight.Normal)
+        self._font_active = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self._stage_path = None  # built for the current size by _build_stage_geometry
+        self._progress_path = QPainterPath()  # cleared and refilled as progress moves
+        # Sky gradient + base curve, rasterised once per size and sky shade
+        self._bg_pixmap = None
+        self._bg_key = None
         
         # Widgets
         self.compass = CompassWidget(self)
@@ -150,10 +190,16 @@ class MissionStageBar(QWidget):
         self.progress_animation.setDuration(2000)
         
         # Test timer for demo
-        self.demo_timer = QTimer()
+        self.demo_timer = QTimer(self)
+        self.demo_timer.setTimerType(Qt.CoarseTimer)
         self.demo_timer.timeout.connect(self._demo_update)
-        self.demo_timer.start(50)
         self._demo_counter = 0
+        # Wall-clock T+ for the demo, so missed ticks don't slow the clock
+        self._t0 = QElapsedTimer()
+        self._last_secs = -1
+        if demo:
+            self._t0.start()
+            self.demo_timer.start(50)
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -164,126 +210,154 @@ class MissionStageBar(QWidget):
         # Position labels
         self.timer_label.setGeometry(self.width()//2 - 100, 15, 200, 30)
         self.subtitle_label.setGeometry(self.width()//2 - 100, 45, 200, 20)
+        
+        self._build_stage_geometry()
+        self._bg_pixmap = None
     
     def paintEvent(self, event):
+        # Color transitions based on progress (lighter to darker blue); the
+        # shades are whole numbers, so the backdrop only changes in steps
+        base_light = max(70 - int(self._progress * 50), 20)
+        base_mid = max(90 - int(self._progress * 60), 30)
+        if self._bg_pixmap is None or self._bg_key != (base_light, base_mid):
+            self._render_background(base_light, base_mid)
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Draw curved path
+        self._draw_curved_stage_path(painter)
+    
+    def _render_background(self, base_light, base_mid):
+        if self._stage_path is None:
+            self._build_stage_geometry()
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Background gradient (darkening sky effect)
         gradient = QLinearGradient(0, 0, 0, self.height())
-        
-        # Color transitions based on progress (lighter to darker blue)
-        base_light = max(70 - int(self._progress * 50), 20)
-        base_mid = max(90 - int(self._progress * 60), 30)
-        
         gradient.setColorAt(0, QColor(50, 70, base_mid + 30))
         gradient.setColorAt(0.5, QColor(40, 60, base_mid))
         gradient.setColorAt(1, QColor(30, 45, base_light))
+        painter.fillRect(QRectF(0, 0, self.width(), self.height()), gradient)
         
-        painter.fillRect(self.rect(), gradient)
+        # Draw background path
+        painter.setPen(_PATH_PEN)
+        painter.drawPath(self._stage_path)
+        painter.end()
         
-        # Draw curved path
-        path_y = self.height() - 25
-        self._draw_curved_stage_path(painter, path_y)
+        self._bg_pixmap = pixmap
+        self._bg_key = (base_light, base_mid)
     
-    def _draw_curved_stage_path(self, painter, center_y):
-        """Draw the curved mission stage progress path"""
+    def _build_stage_geometry(self):
+        """Lay out the stage points and the background curve for the current size."""
+        center_y = self.height() - 25
         width = self.width()
         padding = 140  # Space for compass and gauge
         usable_width = width - 2 * padding
         
-        # Create curved path using QPainterPath
-        path = QPainterPath()
-        
-        # Start point
-        start_x = padding
-        start_y = center_y
-        
         # Control points for curve (simulate ascending rocket trajectory)
         num_stages = len(self.stages)
         segment_width = usable_width / (num_stages - 1)
         
-        points = []
-        for i in range(num_stages):
-            x = start_x + i * segment_width
-            # Curved upward trajectory
-            curve_factor = (i / (num_stages - 1)) ** 0.7
-            y = center_y - curve_factor * 15
-            points.append((x, y))
+        # Stage points as flat x / y arrays
+        xs = array('d', (padding + i * segment_width for i in range(num_stages)))
+        # Curved upward trajectory
+        ys = array('d', (center_y - (i / (num_stages - 1)) ** 0.7 * 15 for i in range(num_stages)))
         
         # Draw smooth curve through points
-        path.moveTo(points[0][0], points[0][1])
-        
-        for i in range(1, len(points)):
-            # Smooth curve using quadratic bezier
-            if i < len(points) - 1:
-                ctrl_x = (points[i][0] + points[i-1][0]) / 2
-                ctrl_y = (points[i][1] + points[i-1][1]) / 2 - 8
-                path.quadTo(ctrl_x, ctrl_y, points[i][0], points[i][1])
-            else:
-                path.lineTo(points[i][0], points[i][1])
-        
-        # Draw background path
-        painter.setPen(QPen(QColor(80, 100, 140, 120), 4))
-        painter.drawPath(path)
-        
-        # Draw progress path
-        progress_path = QPainterPath()
-        progress_path.moveTo(points[0][0], points[0][1])
+        path = self._stage_path if self._stage_path is not None else QPainterPath()
+        path.clear()
+        path.moveTo(xs[0], ys[0])
+        for i in range(1, num_stages):
+            self._extend_path(path, xs, ys, i)
+        
+        self._xs = xs
+        self._ys = ys
+        self._label_widths = {
+            is_active: [QFontMetrics(font, self).horizontalAdvance(t) for t in self.stages]
+            for is_active, font in ((False, self._font_inactive), (True, self._font_active))
+        }
+        self._segment_width = segment_width
+        self._usable_width = usable_width
+        self._stage_path = path
+        self._progress_path_at = None
+    
+    @staticmethod
+    def _extend_path(path, xs, ys, i):
+        """Segment into point i: a quadratic bezier, or a straight line for the last one."""
+        x1, y1 = xs[i], ys[i]
+        if i < len(xs) - 1:
+            path.quadTo((xs[i-1] + x1) * 0.5, (ys[i-1] + y1) * 0.5 - 8, x1, y1)
+        else:
+            path.lineTo(x1, y1)
+    
+    def _build_progress_path(self):
+        xs, ys = self._xs, self._ys
+        progress_path = self._progress_path
+        progress_path.clear()
+        progress_path.moveTo(xs[0], ys[0])
         
-        total_length = usable_width
-        progress_length = total_length * self._progress
+        segment_len = self._segment_width
+        progress_length = self._usable_width * self._progress
         
         current_length = 0
-        for i in range(1, len(points)):
-            segment_len = segment_width
-            
+        for i in range(1, len(xs)):
             if current_length + segment_len <= progress_length:
                 # Full segment
-                if i < len(points) - 1:
-                    ctrl_x = (points[i][0] + points[i-1][0]) / 2
-                    ctrl_y = (points[i][1] + points[i-1][1]) / 2 - 8
-                    progress_path.quadTo(ctrl_x, ctrl_y, points[i][0], points[i][1])
-                else:
-                    progress_path.lineTo(points[i][0], points[i][1])
+                self._extend_path(progress_path, xs, ys, i)
             elif current_length < progress_length:
                 # Partial segment
                 ratio = (progress_length - current_length) / segment_len
-                end_x = points[i-1][0] + (points[i][0] - points[i-1][0]) * ratio
-                end_y = points[i-1][1] + (points[i][1] - points[i-1][1]) * ratio
+                end_x = xs[i-1] + (xs[i] - xs[i-1]) * ratio
+                end_y = ys[i-1] + (ys[i] - ys[i-1]) * ratio
                 progress_path.lineTo(end_x, end_y)
                 break
             
             current_length += segment_len
+    
+    def _draw_curved_stage_path(self, painter):
+        """Draw the curved mission stage progress path"""
+        # The base curve is part of the cached background pixmap.
+        # Progress path only changes with progress; reuse it between frames
+        if self._progress_path_at != self._progress:
+            self._build_progress_path()
+            self._progress_path_at = self._progress
         
         # Glowing progress path
-        painter.setPen(QPen(QColor(100, 200, 255, 250), 5))
-        painter.drawPath(progress_path)
-        
-        # Draw stage markers and labels
-        for i, (x, y) in enumerate(points):
-            # Determine if stage is completed
-            stage_progress = i / (num_stages - 1)
-            is_active = self._progress >= stage_progress
-            
-            # Stage marker
+        painter.setPen(_PROGRESS_PEN)
+        painter.drawPath(self._progress_path)
+        
+        # Draw stage markers and labels. Stages complete in order, so the
+        # active ones are a prefix; each style is set once per pass.
+        xs, ys, stages = self._xs, self._ys, self.stages
+        last = len(stages) - 1
+        n_active = sum(1 for i in range(len(stages)) if self._progress >= i / last)
+        groups = ((False, range(n_active, len(stages))), (True, range(n_active)))
+        
+        # Pass 1: stage markers
+        for is_active, idx in groups:
             if is_active:
-                painter.setBrush(QColor(100, 200, 255, 220))
-                painter.setPen(QPen(QColor(150, 220, 255), 2))
+                painter.setBrush(_MARKER_ACTIVE_BRUSH)
+                painter.setPen(_MARKER_ACTIVE_PEN)
             else:
-                painter.setBrush(QColor(60, 80, 110, 180))
-                painter.setPen(QPen(QColor(80, 100, 140), 2))
-            
-            painter.drawEllipse(QPointF(x, y), 8, 8)
-            
-            # Stage label
-            painter.setPen(QColor(200, 220, 255) if is_active else QColor(120, 140, 180))
-            font = QFont("Segoe UI", 9, QFont.Weight.Bold if is_active else QFont.Weight.Normal)
-            painter.setFont(font)
-            
-            text = self.stages[i]
-            text_width = painter.fontMetrics().horizontalAdvance(text)
-            painter.drawText(int(x - text_width/2), int(y + 25), text)
+                painter.setBrush(_MARKER_INACTIVE_BRUSH)
+                painter.setPen(_MARKER_INACTIVE_PEN)
+            for i in idx:
+                painter.drawEllipse(QPointF(xs[i], ys[i]), 8, 8)
+        
+        # Pass 2: stage labels, centred with widths measured at layout time
+        for is_active, idx in groups:
+            painter.setPen(_STAGE_COLORS[is_active])
+            painter.setFont(self._font_active if is_active else self._font_inactive)
+            widths = self._label_widths[is_active]
+            for i in idx:
+                painter.drawText(int(xs[i] - widths[i]/2), int(ys[i] + 25), stages[i])
     
     def advance_stage(self):
         """Move to next mission stage with animation"""
@@ -323,10 +397,14 @@ class MissionStageBar(QWidget):
         self.compass.setAngle(sim_heading)
         self.accel_gauge.setValue(sim_speed)
         
-        # Update timer
-        seconds = self._demo_counter // 20
-        mins = seconds // 60
-        secs = seconds % 60
+        # Update timer once per second rather than every tick
+        if not self._t0.isValid():
+            self._t0.start()
+        seconds = self._t0.elapsed() // 1000
+        if seconds == self._last_secs:
+            return
+        self._last_secs = seconds
+        mins, secs = divmod(seconds, 60)
         self.timer_label.setText(f"T+ {mins:02d}:{secs:02d}")
     
     def get_progress(self):
@@ -1,22 +1,34 @@
 # serial_preprocessor.py
-# Handles XBee telemetry via COM port and emits parsed rows in real time
+# Handles XBee telemetry via COM port and queues parsed rows for the GUI to drain
 
 import serial
 import threading
 import re
+from collections import deque
 from PySide6.QtCore import QObject, Signal
 
+# Field patterns, compiled once for every frame the worker parses
+_NUM_RE = re.compile(r"([-+]?\d*\.?\d+)")
+_T_RE = re.compile(r"T=([-+]?\d*\.?\d+)")
+_H_RE = re.compile(r"H=([-+]?\d*\.?\d+)")
+_P_RE = re.compile(r"P=([-+]?\d*\.?\d+)")
+_ALT_RE = re.compile(r"Alt=([-+]?\d*\.?\d+)")
+_LAT_RE = re.compile(r"Lat=([-+]?\d*\.?\d+)")
+_LON_RE = re.compile(r"Lon=([-+]?\d*\.?\d+)")
+_VEL_RE = re.compile(r"Vel=([-+]?\d*\.?\d+)")
+
 
 class XBeeTelemetryWorker(QObject):
     """
-    Reads incoming serial data from XBee, parses telemetry lines, and emits complete rows
-    as dictionaries through the rowReady signal.
+    Reads incoming serial data from XBee, parses telemetry lines, and queues complete rows
+    as dictionaries; the GUI side collects them with drain() from a timer.
     Emits:
-      - rowReady(dict)
       - connected(str)         -> when port opened successfully (payload: port string)
       - connection_lost(str)   -> when port unexpectedly closes or an error occurs
     """
-    rowReady = Signal(dict)
+    # Rows kept if the GUI stalls; the oldest are dropped past this
+    QUEUE_LEN = 4096
+
     connected = Signal(str)
     connection_lost = Signal(str)
 
@@ -27,6 +39,8 @@ class XBeeTelemetryWorker(QObject):
         self._run_flag = False
         self._thread = None
         self._ser = None
+        # deque append/popleft are atomic, so the reader thread never waits on the GUI
+        self._rows = deque(maxlen=self.QUEUE_LEN)
 
     # -------------------------------
     # Thread Lifecycle Management
@@ -49,6 +63,17 @@ class XBeeTelemetryWorker(QObject):
         except Exception:
             pass
 
+    def drain(self, limit=256):
+        """Pop up to limit queued rows, oldest first. Call from the GUI thread."""
+        rows = []
+        pop = self._rows.popleft
+        try:
+            for _ in range(limit):
+                rows.append(pop())
+        except IndexError:
+            pass
+        return rows
+
     # -------------------------------
     # Data Parsing Logic
     # -------------------------------
@@ -62,33 +87,33 @@ class XBeeTelemetryWorker(QObject):
 
             # PRIMARY SENSORS
             if line.startswith("Gyro:"):
-                matches = re.findall(r"([-+]?\d*\.?\d+)", line)
+                matches = _NUM_RE.findall(line)
                 if len(matches) >= 3:
                     row["gyro_x"], row["gyro_y"], row["gyro_z"] = map(float, matches[:3])
 
             elif line.startswith("BME:"):
-                t = re.search(r"T=([-+]?\d*\.?\d+)", line)
-                h = re.search(r"H=([-+]?\d*\.?\d+)", line)
-                p = re.search(r"P=([-+]?\d*\.?\d+)", line)
+                t = _T_RE.search(line)
+                h = _H_RE.search(line)
+                p = _P_RE.search(line)
                 if t and h and p:
                     row["bme_temp"] = float(t.group(1))
                     row["bme_h"] = float(h.group(1))
                     row["bme_p"] = float(p.group(1))
 
             elif line.startswith("BMP:"):
-                t = re.search(r"T=([-+]?\d*\.?\d+)", line)
-                p = re.search(r"P=([-+]?\d*\.?\d+)", line)
-                alt = re.search(r"Alt=([-+]?\d*\.?\d+)", line)
+                t = _T_RE.search(line)
+                p = _P_RE.search(line)
+                alt = _ALT_RE.search(line)
                 if t and p and alt:
                     row["bmp_temp"] = float(t.group(1))
                     row["bmp_p"] = float(p.group(1))
                     row["bmp_alt"] = float(alt.group(1))
 
             elif line.startswith("GPS:"):
-                lat = re.search(r"Lat=([-+]?\d*\.?\d+)", line)
-                lon = re.search(r"Lon=([-+]?\d*\.?\d+)", line)
-                alt = re.search(r"Alt=([-+]?\d*\.?\d+)", line)
-                vel = re.search(r"Vel=([-+]?\d*\.?\d+)", line)
+                lat = _LAT_RE.search(line)
+                lon = _LON_RE.search(line)
+                alt = _ALT_RE.search(line)
+                vel = _VEL_RE.search(line)
                 if lat and lon and alt:
                     row["gps_lat"] = float(lat.group(1))
                     row["gps_lon"] = float(lon.group(1))
@@ -98,32 +123,32 @@ class XBeeTelemetryWorker(QObject):
 
             # REDUNDANT SENSORS (suffix _R)
             elif line.startswith("Gyro(R):"):
-                matches = re.findall(r"([-+]?\d*\.?\d+)", line)
+                matches = _NUM_RE.findall(line)
                 if len(matches) >= 3:
                     row["gyro_x_R"], row["gyro_y_R"], row["gyro_z_R"] = map(float, matches[:3])
 
             elif line.startswith("BME(R):"):
-                t = re.search(r"T=([-+]?\d*\.?\d+)", line)
-                h = re.search(r"H=([-+]?\d*\.?\d+)", line)
-                p = re.search(r"P=([-+]?\d*\.?\d+)", line)
+                t = _T_RE.search(line)
+                h = _H_RE.search(line)
+                p = _P_RE.search(line)
                 if t and h and p:
                     row["bme_temp_R"] = float(t.group(1))
                     row["bme_h_R"] = float(h.group(1))
                     row["bme_p_R"] = float(p.group(1))
 
             elif line.startswith("BMP(R):"):
-                t = re.search(r"T=([-+]?\d*\.?\d+)", line)
-                p = re.search(r"P=([-+]?\d*\.?\d+)", line)
-                alt = re.search(r"Alt=([-+]?\d*\.?\d+)", line)
+                t = _T_RE.search(line)
+                p = _P_RE.search(line)
+                alt = _ALT_RE.search(line)
                 if t and p and alt:
                     row["bmp_temp_R"] = float(t.group(1))
                     row["bmp_p_R"] = float(p.group(1))
                     row["bmp_alt_R"] = float(alt.group(1))
 
             elif line.startswith("GPS(R):"):
-                lat = re.search(r"Lat=([-+]?\d*\.?\d+)", line)
-                lon = re.search(r"Lon=([-+]?\d*\.?\d+)", line)
-                alt = re.search(r"Alt=([-+]?\d*\.?\d+)", line)
+                lat = _LAT_RE.search(line)
+                lon = _LON_RE.search(line)
+                alt = _ALT_RE.search(line)
                 if lat and lon and alt:
                     row["gps_lat_R"] = float(lat.group(1))
                     row["gps_lon_R"] = float(lon.group(1))
@@ -135,7 +160,7 @@ class XBeeTelemetryWorker(QObject):
     # Worker Loop
     # -------------------------------
     def _run_worker(self):
-        """Main loop: open serial, read lines, parse frames, and emit."""
+        """Main loop: open serial, read lines, parse frames, and queue rows."""
         try:
             self._ser = serial.Serial(self.port, self.baud, timeout=1)
             self.connected.emit(self.port)
@@ -161,7 +186,7 @@ class XBeeTelemetryWorker(QObject):
                     if buffer_lines:
                         parsed = self._parse_frame(buffer_lines)
                         if parsed:
-                            self.rowReady.emit(parsed)
+                            self._rows.append(parsed)
                     buffer_lines = []
                 elif not line.startswith("---"):
                     buffer_lines.append(line)
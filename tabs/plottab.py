@@ -40,6 +40,20 @@ PLOT_CONFIGS = [
     ("Batterypct", "Battery (%)", QColor(128, 0, 255)),
 ]
 
+# Column order of the numpy ring the plots are drawn from
+RING_FIELDS = (
+    "Time_s",
+    "Altitudem", "AltitudemREDUNDANT",
+    "TempC", "TempCREDUNDANT",
+    "PressurePa", "PressurePaREDUNDANT",
+    "Batterypct",
+    "Velocityms", "VelocitymsREDUNDANT",
+    "Accelms2", "Accelms2REDUNDANT",
+    "Humiditypct", "HumiditypctREDUNDANT",
+    "WindSpeedms", "WindSpeedmsREDUNDANT",
+)
+RING_COL = {k: i for i, k in enumerate(RING_FIELDS)}
+
 MODEL_CANDIDATES = [
     os.path.join("models", "rocketmultioutputmodellight.pkl"),
     os.path.join(os.getcwd(), "rocketmultioutputmodellight.pkl"),
@@ -72,6 +86,9 @@ class PlotTab(QWidget):
         self.logger = logger
         self.buffer_size = buffer_size
         self.buffer = deque(maxlen=self.buffer_size)
+        # Same rows as plain floats; _redraw slices this instead of building a DataFrame
+        self._ring = np.full((self.buffer_size, len(RING_FIELDS)), np.nan)
+        self._ring_idx = 0
         self._last_draw = 0.0
         self._need_draw = False
 
@@ -138,14 +155,37 @@ class PlotTab(QWidget):
     @Slot(dict)
     def update_plot_data(self, row: dict):
         try:
-            norm = self._normalize_row(row)
-            self.buffer.append(norm)
+            self._push(self._normalize_row(row))
+            self._need_draw = True
+        except Exception as e:
+            print("[PlotTab] update error:", e)
+            if self.logger:
+                self.logger.add_log("ERROR", "PlotTab.update", str(e))
+
+    def update_plot_data_batch(self, rows):
+        """Append several rows at once; the draw timer picks them up as usual."""
+        try:
+            for row in rows:
+                self._push(self._normalize_row(row))
             self._need_draw = True
         except Exception as e:
             print("[PlotTab] update error:", e)
             if self.logger:
                 self.logger.add_log("ERROR", "PlotTab.update", str(e))
 
+    def _push(self, norm: dict):
+        self.buffer.append(norm)
+        self._ring[self._ring_idx % self.buffer_size] = [norm[k] for k in RING_FIELDS]
+        self._ring_idx += 1
+
+    def _ring_rows(self) -> np.ndarray:
+        """Buffered rows oldest first, as one (n, len(RING_FIELDS)) array."""
+        n = self.buffer_size
+        if self._ring_idx <= n:
+            return self._ring[:self._ring_idx].copy()
+        i = self._ring_idx % n
+        return np.concatenate((self._ring[i:], self._ring[:i]))
+
     def _normalize_row(self, row: dict) -> dict:
         out = {}
         t = None
@@ -184,8 +224,7 @@ class PlotTab(QWidget):
                     self._csv_mtime = mtime
                     df = pd.read_csv(self.csv_path)
                     for r in df.tail(self.buffer_size).to_dict(orient="records"):
-                        norm = self._normalize_row(r)
-                        self.buffer.append(norm)
+                        self._push(self._normalize_row(r))
                         self._need_draw = True
             except Exception as e:
                 print("[PlotTab] CSV read error:", e)
@@ -201,21 +240,22 @@ class PlotTab(QWidget):
             self._ml_last_ts = now
 
     def _redraw(self):
-        if not self.buffer:
+        if not self._ring_idx:
             return
-        df = pd.DataFrame(list(self.buffer))
-        if "Time_s" in df.columns:
-            x = df["Time_s"].fillna(method="ffill").fillna(0).values
-        else:
-            x = np.arange(len(df))
+        data = self._ring_rows()
+        x = data[:, RING_COL["Time_s"]]
+        gaps = np.isnan(x)
+        if gaps.any():
+            # forward-fill missing times, then zero any leading gap
+            last = np.maximum.accumulate(np.where(gaps, 0, np.arange(len(x))))
+            x = x[last]
+            x[np.isnan(x)] = 0
         for i, (sensor, _, _) in enumerate(PLOT_CONFIGS):
             prim_key, red_key = PRIMARY_REDUNDANT.get(sensor, (sensor, None))
-            y = df.get(prim_key, pd.Series([np.nan] * len(x))).values
-            self.curves[i].setData(x, y)
+            self.curves[i].setData(x, data[:, RING_COL[prim_key]])
             # Redundant visual line
-            if red_key and red_key in df.columns:
-                y_red = df.get(red_key, pd.Series([np.nan] * len(x))).values
-                self.curves_red[i].setData(x, y_red)
+            if red_key:
+                self.curves_red[i].setData(x, data[:, RING_COL[red_key]])
                 self.curves_red[i].show()
             else:
                 self.curves_red[i].hide()